@@ -5,9 +5,11 @@ Including hidden GPS data, steganographic content, and embedded information
 """
 
 import os
+import re
 import sys
 import json
 import struct
+import hashlib
 import binascii
 from pathlib import Path
 
@@ -26,6 +28,45 @@ try:
 except ImportError:
     EXIFREAD_AVAILABLE = False
 
+# Extracted strings are printable ASCII only, so [0-9] matches exactly what
+# str.isdigit() would, but the scan runs inside the C regex engine.
+_DIGIT_RE = re.compile(r"[0-9]")
+
+# WebP chunks that carry metadata worth previewing
+_WEBP_METADATA_CHUNKS = frozenset({b"EXIF", b"XMP ", b"ICCP"})
+
+# Common metadata signatures to look for in raw file content
+SIGNATURES = {
+    b"GPS": "GPS data signature",
+    b"EXIF": "EXIF data signature",
+    b"<?xml": "XML metadata",
+    b"<x:xmpmeta": "XMP metadata",
+    b"<rdf:RDF": "RDF metadata",
+    b"GPS\x00": "GPS null-terminated",
+    b"coordinates": "Coordinates text",
+    b"latitude": "Latitude text",
+    b"longitude": "Longitude text",
+    b"location": "Location text",
+    b"place": "Place text",
+    b"address": "Address text",
+    b"geo:": "Geo URI scheme",
+}
+
+# One alternation over all signatures, longest first. A match at a position
+# implies a match for every signature that is a prefix of it (e.g. GPS for
+# GPS\x00), which _SIGNATURE_PREFIXES records.
+_SIGNATURE_RE = re.compile(
+    b"("
+    + b"|".join(re.escape(sig) for sig in sorted(SIGNATURES, key=len, reverse=True))
+    + b")"
+)
+_SIGNATURE_PREFIXES = {
+    sig: [other for other in SIGNATURES if sig.startswith(other)] for sig in SIGNATURES
+}
+
+# Binary info values larger than this are summarized instead of copied
+_MAX_INLINE_BYTES = 4096
+
 
 def scan_binary_for_metadata(file_path):
     """Scan binary content for embedded metadata signatures."""
@@ -34,43 +75,28 @@ def scan_binary_for_metadata(file_path):
     with open(file_path, "rb") as f:
         content = f.read()
 
-    # Look for common metadata signatures
-    signatures = {
-        b"GPS": "GPS data signature",
-        b"EXIF": "EXIF data signature",
-        b"<?xml": "XML metadata",
-        b"<x:xmpmeta": "XMP metadata",
-        b"<rdf:RDF": "RDF metadata",
-        b"GPS\x00": "GPS null-terminated",
-        b"coordinates": "Coordinates text",
-        b"latitude": "Latitude text",
-        b"longitude": "Longitude text",
-        b"location": "Location text",
-        b"place": "Place text",
-        b"address": "Address text",
-        b"geo:": "Geo URI scheme",
-    }
+    # Single pass over the content for every signature at once; each search
+    # resumes one byte after the last match so overlapping occurrences (e.g.
+    # "<?xmlatitude") are reported like the per-signature find() loops did
+    positions_map = {sig: [] for sig in SIGNATURES}
+    search = _SIGNATURE_RE.search
+    match = search(content)
+    while match:
+        pos = match.start()
+        for sig in _SIGNATURE_PREFIXES[match.group(1)]:
+            positions_map[sig].append(pos)
+        match = search(content, pos + 1)
 
     found_signatures = []
-    for sig, desc in signatures.items():
-        positions = []
-        start = 0
-        while True:
-            pos = content.find(sig, start)
-            if pos == -1:
-                break
-            positions.append(pos)
-            start = pos + 1
-
+    for sig, desc in SIGNATURES.items():
+        positions = positions_map[sig]
         if positions:
             found_signatures.append(
                 {
                     "signature": sig.decode("utf-8", errors="ignore"),
                     "description": desc,
                     "positions": positions[:10],  # Limit to first 10 occurrences
-                    "context": (
-                        extract_context(content, positions[0]) if positions else None
-                    ),
+                    "context": extract_context(content, positions[0]),
                 }
             )
 
@@ -103,19 +129,19 @@ def extract_context(content, position, context_size=50):
 def extract_text_strings(content, min_length=4):
     """Extract readable text strings from binary content."""
     strings = []
-    current_string = ""
+    buf = bytearray()
 
     for byte in content:
         if 32 <= byte <= 126:  # Printable ASCII
-            current_string += chr(byte)
+            buf.append(byte)
         else:
-            if len(current_string) >= min_length:
-                strings.append(current_string)
-            current_string = ""
+            if len(buf) >= min_length:
+                strings.append(buf.decode("ascii"))
+            buf.clear()
 
     # Don't forget the last string
-    if len(current_string) >= min_length:
-        strings.append(current_string)
+    if len(buf) >= min_length:
+        strings.append(buf.decode("ascii"))
 
     # Filter for potentially interesting strings
     interesting_strings = []
@@ -138,7 +164,7 @@ def extract_text_strings(content, min_length=4):
         s_lower = s.lower()
         if any(keyword in s_lower for keyword in keywords):
             interesting_strings.append(s)
-        elif len(s) > 20 and any(c.isdigit() for c in s):  # Long strings with numbers
+        elif len(s) > 20 and _DIGIT_RE.search(s):  # Long strings with numbers
             interesting_strings.append(s)
 
     return {
@@ -164,21 +190,20 @@ def parse_webp_chunks(content):
             chunk_id = content[pos : pos + 4]
             chunk_size = struct.unpack("<I", content[pos + 4 : pos + 8])[0]
 
-            chunk_data = content[pos + 8 : pos + 8 + chunk_size]
+            chunk = {
+                "id": chunk_id.decode("ascii", errors="ignore"),
+                "size": chunk_size,
+                "position": pos,
+            }
 
-            chunks.append(
-                {
-                    "id": chunk_id.decode("ascii", errors="ignore"),
-                    "size": chunk_size,
-                    "position": pos,
-                    "data_preview": chunk_data[:100].hex() if chunk_data else "",
-                    "data_ascii": (
-                        chunk_data[:100].decode("utf-8", errors="ignore")
-                        if chunk_data
-                        else ""
-                    ),
-                }
-            )
+            # Only metadata chunks get a data preview; image bitstream chunks
+            # (VP8, VP8L, ANMF, ...) are skipped without slicing their payload.
+            if chunk_id in _WEBP_METADATA_CHUNKS:
+                preview = content[pos + 8 : pos + 8 + min(chunk_size, 100)]
+                chunk["data_preview"] = preview.hex()
+                chunk["data_ascii"] = preview.decode("utf-8", errors="ignore")
+
+            chunks.append(chunk)
 
             # Move to next chunk (with padding)
             pos += 8 + chunk_size
@@ -191,6 +216,21 @@ def parse_webp_chunks(content):
     return chunks
 
 
+def summarize_image_info(info):
+    """Copy PIL image info, replacing large binary blobs with a size/hash summary."""
+    info_data = {}
+    for key, value in info.items():
+        if isinstance(value, (bytes, bytearray)) and len(value) > _MAX_INLINE_BYTES:
+            info_data[key] = {
+                "_type": "bytes",
+                "len": len(value),
+                "sha1": hashlib.sha1(value).hexdigest(),
+            }
+        else:
+            info_data[key] = value
+    return info_data
+
+
 def deep_scan_image(file_path):
     """Perform comprehensive metadata extraction."""
     file_path = Path(file_path)
@@ -218,7 +258,7 @@ def deep_scan_image(file_path):
                     "mode": img.mode,
                     "size": img.size,
                     "info_keys": list(img.info.keys()),
-                    "info_data": dict(img.info),
+                    "info_data": summarize_image_info(img.info),
                     "has_exif_method": hasattr(img, "_getexif"),
                     "has_getexif_method": hasattr(img, "getexif"),
                 }
@@ -16,9 +16,66 @@ This enhanced version identifies all public areas within the wedge including:
 import folium
 import requests
 import json
-from typing import List, Tuple, Dict, Any
-from shapely.geometry import Point, Polygon as ShapelyPolygon
+import gzip
+import hashlib
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Tuple, Dict, Any, Iterator, Optional
+from shapely.geometry import Point, Polygon as ShapelyPolygon, box
+from shapely.prepared import prep
 import math
+import time
+
+from public_areas_utils import iter_overpass_elements, stream_overpass_response
+
+try:
+    from shapely import contains_xy
+except ImportError:  # Shapely < 2.0
+    try:
+        from shapely.vectorized import contains as contains_xy
+    except ImportError:
+        contains_xy = None
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def _pip_convex(px, py, vx, vy):
+        """Strict point-in-convex-polygon test; vx/vy are closed vertex rings."""
+        sign = 0.0
+        for i in range(len(vx) - 1):
+            cross = (vx[i + 1] - vx[i]) * (py - vy[i]) - (vy[i + 1] - vy[i]) * (
+                px - vx[i]
+            )
+            if cross == 0.0:
+                return False
+            if sign == 0.0:
+                sign = cross
+            elif (cross > 0.0) != (sign > 0.0):
+                return False
+        return True
+
+    @njit(cache=True, parallel=True)
+    def _pip_convex_batch(pxs, pys, vx, vy):
+        out = np.empty(len(pxs), dtype=np.bool_)
+        for i in prange(len(pxs)):
+            out[i] = _pip_convex(pxs[i], pys[i], vx, vy)
+        return out
+
+# Shared HTTP session: keeps the Overpass connection alive between requests
+# and asks for a compressed response body
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {"Accept-Encoding": "gzip, deflate", "User-Agent": "wedge-tool/1.0"}
+)
 
 
 class WedgePublicAreasOverlay:
@@ -30,6 +87,12 @@ class WedgePublicAreasOverlay:
     # Overpass API endpoint
     OVERPASS_URL = "https://overpass-api.de/api/interpreter"
 
+    # Local cache for Overpass responses; query bounds are snapped to this grid
+    # (degrees) so nearby wedges reuse the same cached tile
+    CACHE_DIR = Path.home() / ".cache" / "wedge_overpass"
+    CACHE_TILE_SIZE = 0.01
+    CACHE_MAX_AGE = 86400  # seconds
+
     # Comprehensive color mapping for all outdoor activity types
     AREA_COLORS = {
         "park": {"color": "green", "fillColor": "lightgreen", "icon": "tree"},
@@ -54,15 +117,140 @@ class WedgePublicAreasOverlay:
         "default": {"color": "gray", "fillColor": "lightgray", "icon": "map-marker"},
     }
 
+    # Result buckets, in display order
+    AREA_TYPES = (
+        "park",
+        "biking",
+        "hiking",
+        "walking",
+        "running",
+        "recreation",
+        "water",
+        "tourism",
+        "education",
+        "playground",
+        "fitness",
+        "default",
+    )
+
+    # Line area types drawn with a heavier stroke
+    _TRAIL_TYPES = frozenset(("biking", "hiking", "walking", "running"))
+
+    # Exact (key, value) tag matches for each area type
+    TAG_TO_AREA = {
+        # Biking
+        ("highway", "cycleway"): "biking",
+        ("bicycle", "designated"): "biking",
+        ("bicycle", "yes"): "biking",
+        ("route", "bicycle"): "biking",
+        # Running and fitness
+        ("sport", "running"): "running",
+        ("leisure", "track"): "fitness",
+        ("leisure", "fitness_station"): "fitness",
+        ("leisure", "fitness_centre"): "fitness",
+        # Hiking
+        ("highway", "path"): "hiking",
+        ("highway", "track"): "hiking",
+        ("highway", "bridleway"): "hiking",
+        ("route", "hiking"): "hiking",
+        ("foot", "designated"): "hiking",
+        # Walking
+        ("highway", "footway"): "walking",
+        ("foot", "yes"): "walking",
+        ("route", "foot"): "walking",
+        # Parks and green spaces
+        ("leisure", "park"): "park",
+        ("leisure", "garden"): "park",
+        ("leisure", "nature_reserve"): "park",
+        ("landuse", "forest"): "park",
+        ("landuse", "recreation_ground"): "park",
+        # Playgrounds
+        ("leisure", "playground"): "playground",
+        # Recreation facilities
+        ("leisure", "sports_centre"): "recreation",
+        ("leisure", "pitch"): "recreation",
+        ("leisure", "golf_course"): "recreation",
+        ("leisure", "swimming_pool"): "recreation",
+        ("amenity", "community_centre"): "recreation",
+        # Water features
+        ("natural", "water"): "water",
+        ("natural", "beach"): "water",
+        ("leisure", "marina"): "water",
+        # Tourism
+        ("tourism", "attraction"): "tourism",
+        ("tourism", "viewpoint"): "tourism",
+        ("tourism", "picnic_site"): "tourism",
+        ("tourism", "camp_site"): "tourism",
+        # Education
+        ("amenity", "university"): "education",
+        ("amenity", "school"): "education",
+        ("amenity", "library"): "education",
+    }
+
+    # Tags whose presence alone (any value) determines the area type
+    KEY_PRESENCE = {"cycleway": "biking", "waterway": "water"}
+
+    # Classification priority when an element matches several area types
+    AREA_PRIORITY = {
+        "biking": 0,
+        "running": 1,
+        "fitness": 1,
+        "hiking": 2,
+        "walking": 3,
+        "park": 4,
+        "playground": 5,
+        "recreation": 6,
+        "water": 7,
+        "tourism": 8,
+        "education": 9,
+    }
+
+    # Activity line added to popups for trail/fitness area types
+    _ACTIVITY_EMOJI = {
+        "biking": "🚴 Biking Trail/Path<br>",
+        "hiking": "🥾 Hiking Trail<br>",
+        "walking": "🚶 Walking Path<br>",
+        "running": "🏃 Running Track/Trail<br>",
+        "fitness": "💪 Fitness Station/Gym<br>",
+    }
+
+    # Tags shown in popups when present
+    RELEVANT_TAGS = (
+        "surface",
+        "difficulty",
+        "length",
+        "operator",
+        "opening_hours",
+        "website",
+        "phone",
+    )
+    _RELEVANT = frozenset(RELEVANT_TAGS)
+    _RELEVANT_ORDER = {tag: i for i, tag in enumerate(RELEVANT_TAGS)}
+
     def __init__(self, wedge_corners: List[List[float]]):
         """
         Initialize with the specific wedge coordinates.
 
         Args:
-            wedge_corners: List of [lat, lon] coordinates defining the wedge polygon
+            wedge_corners: List (or (N, 2) array) of [lat, lon] coordinates
+                defining the wedge polygon
         """
-        self.wedge_corners = wedge_corners
+        self._corners_np = np.asarray(wedge_corners, dtype=np.float64)
+        self.wedge_corners = self._corners_np.tolist()
         self.wedge_polygon = self._create_wedge_polygon()
+        # Prepared geometry caches the edge index for repeated point tests
+        self._prepared = prep(self.wedge_polygon)
+        # Axis-aligned bounds used to reject points before any polygon test
+        (south, west), (north, east) = (
+            self._corners_np.min(axis=0),
+            self._corners_np.max(axis=0),
+        )
+        self._bbox = (float(south), float(north), float(west), float(east))
+        # Closed vertex rings for the compiled convex test
+        ring = np.vstack((self._corners_np, self._corners_np[:1]))
+        self._vx = np.ascontiguousarray(ring[:, 1])
+        self._vy = np.ascontiguousarray(ring[:, 0])
+        self._convex = self.wedge_polygon.equals(self.wedge_polygon.convex_hull)
 
     def _create_wedge_polygon(self) -> ShapelyPolygon:
         """Create a Shapely polygon from the wedge corners for point-in-polygon testing."""
@@ -70,24 +258,93 @@ class WedgePublicAreasOverlay:
         coords = [(corner[1], corner[0]) for corner in self.wedge_corners]
         return ShapelyPolygon(coords)
 
-    def _point_in_wedge(self, lat: float, lon: float) -> bool:
-        """Check if a point is inside the wedge polygon."""
-        point = Point(lon, lat)  # Shapely uses (x, y) = (lon, lat)
-        return self.wedge_polygon.contains(point)
+    def _points_in_wedge(self, lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+        """Check which (lon, lat) points are inside the wedge polygon."""
+        south, north, west, east = self._bbox
+        mask = (lons >= west) & (lons <= east) & (lats >= south) & (lats <= north)
+        candidates = np.flatnonzero(mask)
+        if not len(candidates):
+            return mask
+
+        # Only points inside the bounding box reach the polygon test
+        cand_lons, cand_lats = lons[candidates], lats[candidates]
+        if NUMBA_AVAILABLE and self._convex:
+            mask[candidates] = _pip_convex_batch(
+                cand_lons, cand_lats, self._vx, self._vy
+            )
+        elif contains_xy is not None:
+            mask[candidates] = contains_xy(self.wedge_polygon, cand_lons, cand_lats)
+        else:
+            mask[candidates] = [
+                self._prepared.contains(Point(x, y))
+                for x, y in zip(cand_lons, cand_lats)
+            ]
+        return mask
+
+    def _elements_in_wedge(
+        self, elements: List[Dict], keep_coords: bool = False
+    ) -> np.ndarray:
+        """
+        Vectorized wedge test for a batch of OSM elements.
+
+        All node/way coordinates are flattened into two float64 arrays and tested
+        against the wedge polygon in a single call. A way qualifies if any of its
+        points lies inside the wedge.
+
+        Args:
+            elements: OSM elements to test
+            keep_coords: Keep the flattened arrays on the overlay and record each
+                element's (start, stop) offsets as element["_slice"] so overlay
+                construction can reuse them
 
-    def get_comprehensive_public_areas(self) -> Dict[str, List[Dict]]:
+        Returns:
+            Boolean array with one entry per element
+        """
+        lats, lons, starts = [], [], []
+        for element in elements:
+            starts.append(len(lats))
+            if element["type"] == "node":
+                lats.append(element["lat"])
+                lons.append(element["lon"])
+            elif element["type"] == "way" and "geometry" in element:
+                for node in element["geometry"]:
+                    lats.append(node["lat"])
+                    lons.append(node["lon"])
+
+        inside = np.zeros(len(elements), dtype=bool)
+        if not lats:
+            return inside
+
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        if keep_coords:
+            self._coord_lats, self._coord_lons = lats, lons
+            for element, start, stop in zip(elements, starts, starts[1:] + [len(lats)]):
+                element["_slice"] = (start, stop)
+        starts = np.asarray(starts, dtype=np.intp)
+        mask = self._points_in_wedge(lons, lats)
+
+        # Elements without coordinates have an empty (start, stop) range
+        counts = np.diff(np.append(starts, len(lats)))
+        has_points = counts > 0
+        inside[has_points] = np.logical_or.reduceat(mask, starts[has_points])
+        return inside
+
+    def get_comprehensive_public_areas(
+        self, max_age_seconds: Optional[float] = None
+    ) -> Dict[str, List[Dict]]:
         """
         Fetch all types of public areas and outdoor activities within the wedge bounds.
 
+        Args:
+            max_age_seconds: Maximum age of a cached Overpass response to reuse
+                (defaults to CACHE_MAX_AGE; 0 always queries Overpass)
+
         Returns:
             Dictionary with area types as keys and lists of area data as values
         """
-        # Calculate bounding box for the wedge
-        lats = [corner[0] for corner in self.wedge_corners]
-        lons = [corner[1] for corner in self.wedge_corners]
-
-        south, north = min(lats), max(lats)
-        west, east = min(lons), max(lons)
+        # Bounding box for the wedge
+        south, north, west, east = self._bbox
 
         # Add small buffer for edge cases
         buffer = 0.005  # ~500m buffer
@@ -96,6 +353,13 @@ class WedgePublicAreasOverlay:
         west -= buffer
         east += buffer
 
+        # Expand to the tile grid so the query (and its cache key) is stable
+        tile = self.CACHE_TILE_SIZE
+        south = round(math.floor(south / tile) * tile, 6)
+        west = round(math.floor(west / tile) * tile, 6)
+        north = round(math.ceil(north / tile) * tile, 6)
+        east = round(math.ceil(east / tile) * tile, 6)
+
         # Comprehensive Overpass query for ALL outdoor and public activities
         query = f"""
         [out:json][timeout:60];
@@ -164,84 +428,168 @@ class WedgePublicAreasOverlay:
           node["tourism"="viewpoint"]({south},{west},{north},{east});
           node["natural"="peak"]({south},{west},{north},{east});
           node["leisure"="fitness_station"]({south},{west},{north},{east});
-        );
-        out geom;
+        )->.candidates;
+
+        // Stage 1 only returns ids plus node coordinates / way bounds
+        node.candidates;
+        out skel;
+        way.candidates;
+        out ids bb;
         """
 
         try:
             print("🔍 Fetching comprehensive public areas data...")
-            response = requests.post(self.OVERPASS_URL, data=query, timeout=60)
-            response.raise_for_status()
-            data = response.json()
+            node_ids, way_ids = self._select_candidate_ids(
+                self._fetch_overpass(query, max_age_seconds)
+            )
+            print(
+                f"✓ {len(node_ids) + len(way_ids)} candidate elements may touch the wedge"
+            )
+
+            # Stage 2: full tags and geometry for the surviving ids only
+            elements = []
+            if node_ids or way_ids:
+                elements = self._fetch_overpass(
+                    self._geometry_query(node_ids, way_ids), max_age_seconds
+                )
 
             # Organize results by area type and filter by wedge
-            results = {
-                "park": [],
-                "biking": [],
-                "hiking": [],
-                "walking": [],
-                "running": [],
-                "recreation": [],
-                "water": [],
-                "tourism": [],
-                "education": [],
-                "playground": [],
-                "fitness": [],
-                "default": [],
-            }
+            results = {area_type: [] for area_type in self.AREA_TYPES}
 
             processed_count = 0
             inside_wedge_count = 0
 
-            for element in data.get("elements", []):
+            # Elements are streamed; only those inside the wedge bbox are kept
+            candidates = []
+            for element in elements:
                 processed_count += 1
+                if self._element_in_bbox(element):
+                    candidates.append(element)
+
+            in_wedge = self._elements_in_wedge(candidates, keep_coords=True)
 
-                # Check if element is inside the wedge
-                if self._element_in_wedge(element):
+            for element, inside in zip(candidates, in_wedge):
+                if inside:
                     inside_wedge_count += 1
                     area_type = self._classify_comprehensive_area(element)
                     results[area_type].append(element)
 
             print(
-                f"✓ Processed {processed_count} elements, {inside_wedge_count} inside wedge"
+                f"✓ Processed {processed_count} geometry elements, "
+                f"{inside_wedge_count} inside wedge"
             )
             return results
 
         except Exception as e:
             print(f"❌ Error fetching public areas data: {e}")
-            return {
-                area_type: []
-                for area_type in [
-                    "park",
-                    "biking",
-                    "hiking",
-                    "walking",
-                    "running",
-                    "recreation",
-                    "water",
-                    "tourism",
-                    "education",
-                    "playground",
-                    "fitness",
-                    "default",
-                ]
-            }
+            return {area_type: [] for area_type in self.AREA_TYPES}
+
+    def _select_candidate_ids(
+        self, elements: Iterator[Dict]
+    ) -> Tuple[List[int], List[int]]:
+        """
+        Pick the ids worth fetching with full geometry from a stage-1 response.
 
-    def _element_in_wedge(self, element: Dict) -> bool:
-        """Check if an OSM element is within the wedge polygon."""
+        Nodes are tested exactly against the wedge. Ways are kept when their
+        bounding box intersects the wedge; the exact per-vertex test runs later
+        on the full geometry.
+
+        Returns:
+            (node_ids, way_ids)
+        """
+        south, north, west, east = self._bbox
+        nodes, way_ids = [], []
+        for element in elements:
+            if element["type"] == "node":
+                nodes.append(element)
+            elif element["type"] == "way" and "bounds" in element:
+                bounds = element["bounds"]
+                if (
+                    bounds["maxlon"] < west
+                    or bounds["minlon"] > east
+                    or bounds["maxlat"] < south
+                    or bounds["minlat"] > north
+                ):
+                    continue
+                way_box = box(
+                    bounds["minlon"], bounds["minlat"], bounds["maxlon"], bounds["maxlat"]
+                )
+                if self._prepared.intersects(way_box):
+                    way_ids.append(element["id"])
+
+        in_wedge = self._elements_in_wedge(nodes)
+        node_ids = [node["id"] for node, inside in zip(nodes, in_wedge) if inside]
+        return node_ids, way_ids
+
+    @staticmethod
+    def _geometry_query(node_ids: List[int], way_ids: List[int]) -> str:
+        """Build the stage-2 Overpass query returning full geometry for given ids."""
+        statements = []
+        if node_ids:
+            statements.append(f"node(id:{','.join(map(str, node_ids))});")
+        if way_ids:
+            statements.append(f"way(id:{','.join(map(str, way_ids))});")
+        return f"[out:json][timeout:60];({''.join(statements)});out geom;"
+
+    @staticmethod
+    def _cache_key(query: str) -> str:
+        """Cache file stem for an Overpass query."""
+        return hashlib.sha1(query.encode("utf-8")).hexdigest()
+
+    def _fetch_overpass(
+        self, query: str, max_age_seconds: Optional[float] = None
+    ) -> Iterator[Dict]:
+        """
+        Run an Overpass query, serving it from the local disk cache when a
+        response younger than max_age_seconds is already stored.
+
+        The response is parsed incrementally, so elements are yielded while the
+        body is still being received (or read back from the cache).
+
+        Args:
+            query: Overpass QL query string
+            max_age_seconds: Maximum cache age to reuse (defaults to CACHE_MAX_AGE)
+
+        Yields:
+            OSM elements from the response
+        """
+        cache_file = self.CACHE_DIR / f"{self._cache_key(query)}.json.gz"
+
+        if max_age_seconds is None:
+            max_age_seconds = self.CACHE_MAX_AGE
+        try:
+            is_fresh = time.time() - cache_file.stat().st_mtime < max_age_seconds
+        except OSError:
+            is_fresh = False  # no cache entry yet
+        if is_fresh:
+            print(f"📦 Using cached Overpass response: {cache_file.name}")
+            with gzip.open(cache_file, "rb") as f:
+                yield from iter_overpass_elements(f)
+            return
+
+        response = _SESSION.post(self.OVERPASS_URL, data=query, timeout=60, stream=True)
+        response.raise_for_status()
+        yield from stream_overpass_response(response, cache_file, open_cache=gzip.open)
+
+    def _element_in_bbox(self, element: Dict) -> bool:
+        """Check if an OSM element has any point inside the wedge bounding box."""
+        south, north, west, east = self._bbox
         if element["type"] == "node":
-            return self._point_in_wedge(element["lat"], element["lon"])
+            return west <= element["lon"] <= east and south <= element["lat"] <= north
         elif element["type"] == "way" and "geometry" in element:
-            # Check if any point of the way is in the wedge
-            for node in element["geometry"]:
-                if self._point_in_wedge(node["lat"], node["lon"]):
-                    return True
+            return any(
+                west <= node["lon"] <= east and south <= node["lat"] <= north
+                for node in element["geometry"]
+            )
         return False
 
     def _classify_comprehensive_area(self, element: Dict) -> str:
         """
         Classify an OSM element into a specific outdoor activity type.
 
+        Each tag is looked up in the dispatch tables and the highest-priority
+        match wins, so the result does not depend on tag order.
+
         Args:
             element: OSM element data
 
@@ -250,81 +598,26 @@ class WedgePublicAreasOverlay:
         """
         tags = element.get("tags", {})
 
-        # Biking-specific classification
-        if (
-            tags.get("highway") == "cycleway"
-            or "cycleway" in tags
-            or tags.get("bicycle") in ["designated", "yes"]
-            or tags.get("route") == "bicycle"
-        ):
-            return "biking"
-
-        # Running and fitness trails
-        elif (
-            tags.get("sport") == "running"
-            or (tags.get("leisure") == "track" and tags.get("sport") != "motor")
-            or tags.get("leisure") == "fitness_station"
-            or tags.get("leisure") == "fitness_centre"
-        ):
-            return "running" if tags.get("sport") == "running" else "fitness"
-
-        # Hiking trails (more specific paths)
-        elif (
-            tags.get("highway") in ["path", "track", "bridleway"]
-            or tags.get("route") == "hiking"
-            or (tags.get("foot") == "designated" and tags.get("bicycle") != "yes")
-        ):
-            return "hiking"
-
-        # Walking paths (general footways)
-        elif (
-            tags.get("highway") == "footway"
-            or tags.get("foot") == "yes"
-            or tags.get("route") == "foot"
-        ):
-            return "walking"
-
-        # Parks and green spaces
-        elif tags.get("leisure") in ["park", "garden", "nature_reserve"] or tags.get(
-            "landuse"
-        ) in ["forest", "recreation_ground"]:
-            return "park"
-
-        # Playgrounds specifically
-        elif tags.get("leisure") == "playground":
-            return "playground"
-
-        # Recreation facilities
-        elif (
-            tags.get("leisure")
-            in ["sports_centre", "pitch", "golf_course", "swimming_pool"]
-            or tags.get("amenity") == "community_centre"
-        ):
-            return "recreation"
-
-        # Water features
-        elif (
-            tags.get("natural") in ["water", "beach"]
-            or tags.get("waterway")
-            or tags.get("leisure") == "marina"
-        ):
-            return "water"
-
-        # Tourism
-        elif tags.get("tourism") in [
-            "attraction",
-            "viewpoint",
-            "picnic_site",
-            "camp_site",
-        ]:
-            return "tourism"
+        best_type = "default"
+        best_rank = len(self.AREA_PRIORITY)
+        for key, value in tags.items():
+            area_type = self.TAG_TO_AREA.get((key, value)) or self.KEY_PRESENCE.get(key)
+            if area_type is None:
+                continue
+            # Motor racing tracks are not running/fitness trails
+            if key == "leisure" and value == "track" and tags.get("sport") == "motor":
+                continue
 
-        # Education
-        elif tags.get("amenity") in ["university", "school", "library"]:
-            return "education"
+            rank = self.AREA_PRIORITY[area_type]
+            if rank < best_rank:
+                best_type, best_rank = area_type, rank
+                if rank == 0:
+                    break
 
-        else:
-            return "default"
+        # Running and fitness share a priority; sport=running decides between them
+        if best_type in ("running", "fitness"):
+            return "running" if tags.get("sport") == "running" else "fitness"
+        return best_type
 
     def add_to_map(self, map_obj: folium.Map) -> folium.Map:
         """
@@ -337,117 +630,118 @@ class WedgePublicAreasOverlay:
             Modified Folium map object
         """
         public_areas = self.get_comprehensive_public_areas()
+        non_empty = [(t, areas) for t, areas in public_areas.items() if areas]
 
-        # Create feature groups for each area type
-        feature_groups = {}
-        total_areas = 0
-
-        for area_type, areas in public_areas.items():
-            if not areas:
-                continue
-
-            total_areas += len(areas)
-            colors = self.AREA_COLORS.get(area_type, self.AREA_COLORS["default"])
-            feature_group = folium.FeatureGroup(
-                name=f"{area_type.title()} ({len(areas)})"
-            )
-
-            for area in areas:
-                self._add_area_to_group(feature_group, area, area_type, colors)
+        # Feature groups are independent, so build them concurrently and
+        # attach them to the map in the original category order
+        with ThreadPoolExecutor() as executor:
+            groups = list(executor.map(lambda item: self._build_group(*item), non_empty))
 
+        feature_groups = {}
+        for (area_type, _), feature_group in zip(non_empty, groups):
             feature_groups[area_type] = feature_group
             feature_group.add_to(map_obj)
 
+        total_areas = sum(len(areas) for _, areas in non_empty)
         print(
             f"🗺️  Added {total_areas} public areas to map across {len(feature_groups)} categories"
         )
         return map_obj
 
+    def _build_group(self, area_type: str, areas: List[Dict]) -> folium.FeatureGroup:
+        """Build the feature group holding all areas of one type."""
+        colors = self.AREA_COLORS.get(area_type, self.AREA_COLORS["default"])
+        feature_group = folium.FeatureGroup(name=f"{area_type.title()} ({len(areas)})")
+
+        features = []
+        for area in areas:
+            self._add_area_to_group(features, area, area_type, colors)
+
+        # Point features share one icon marker for the whole layer
+        marker = None
+        if any(area["type"] == "node" for area in areas):
+            marker = folium.Marker(
+                icon=folium.Icon(color=colors["color"], icon=colors["icon"], prefix="fa")
+            )
+
+        # One GeoJSON layer per area type instead of one object per area
+        folium.GeoJson(
+            {"type": "FeatureCollection", "features": features},
+            style_function=lambda feature: feature["properties"]["style"],
+            marker=marker,
+            popup=folium.GeoJsonPopup(fields=["popup"], labels=False),
+            tooltip=folium.GeoJsonTooltip(fields=["name"], labels=False),
+        ).add_to(feature_group)
+
+        return feature_group
+
     def _add_area_to_group(
         self,
-        feature_group: folium.FeatureGroup,
+        features: List[Dict],
         area: Dict,
         area_type: str,
         colors: Dict,
     ) -> None:
-        """Add a single area to a feature group with enhanced popup information."""
+        """Append a single area as a GeoJSON feature with enhanced popup information."""
         tags = area.get("tags", {})
         name = tags.get("name", f"Unnamed {area_type}")
 
-        # Create comprehensive popup content
-        popup_content = f"<b>{name}</b><br>"
-        popup_content += f"🏷️ Type: {area_type.title()}<br>"
-
-        # Add specific activity information
-        if area_type == "biking":
-            popup_content += "🚴 Biking Trail/Path<br>"
-        elif area_type == "hiking":
-            popup_content += "🥾 Hiking Trail<br>"
-        elif area_type == "walking":
-            popup_content += "🚶 Walking Path<br>"
-        elif area_type == "running":
-            popup_content += "🏃 Running Track/Trail<br>"
-        elif area_type == "fitness":
-            popup_content += "💪 Fitness Station/Gym<br>"
-
-        # Add relevant tag information
-        relevant_tags = [
-            "surface",
-            "difficulty",
-            "length",
-            "operator",
-            "opening_hours",
-            "website",
-            "phone",
-        ]
-        for tag in relevant_tags:
-            if tag in tags:
-                popup_content += f"{tag.title()}: {tags[tag]}<br>"
+        # Create comprehensive popup content; only the relevant tags that are
+        # actually present are formatted, in RELEVANT_TAGS order
+        present = sorted(tags.keys() & self._RELEVANT, key=self._RELEVANT_ORDER.get)
+        popup_content = "".join(
+            [
+                f"<b>{name}</b><br>🏷️ Type: {area_type.title()}<br>",
+                self._ACTIVITY_EMOJI.get(area_type, ""),
+                *(f"{tag.title()}: {tags[tag]}<br>" for tag in present),
+            ]
+        )
 
         # Add coordinates for reference
         if area["type"] == "node":
             popup_content += f"📍 {area['lat']:.6f}, {area['lon']:.6f}"
 
         if area["type"] == "way" and "geometry" in area:
-            # Handle way geometries (polygons and lines)
-            coordinates = [[node["lat"], node["lon"]] for node in area["geometry"]]
+            # Handle way geometries (polygons and lines), GeoJSON order is (lon, lat)
+            if "_slice" in area:
+                start, stop = area["_slice"]
+                coordinates = np.column_stack(
+                    (self._coord_lons[start:stop], self._coord_lats[start:stop])
+                ).tolist()
+            else:
+                coordinates = [[node["lon"], node["lat"]] for node in area["geometry"]]
 
             if len(coordinates) > 2 and coordinates[0] == coordinates[-1]:
                 # Closed way (polygon)
-                folium.Polygon(
-                    locations=coordinates,
-                    popup=popup_content,
-                    tooltip=name,
-                    color=colors["color"],
-                    weight=2,
-                    fill=True,
-                    fillColor=colors["fillColor"],
-                    fillOpacity=0.4,
-                ).add_to(feature_group)
+                geometry = {"type": "Polygon", "coordinates": [coordinates]}
+                style = {
+                    "color": colors["color"],
+                    "weight": 2,
+                    "fill": True,
+                    "fillColor": colors["fillColor"],
+                    "fillOpacity": 0.4,
+                }
             else:
                 # Open way (line) - make trails more visible
-                weight = (
-                    4 if area_type in ["biking", "hiking", "walking", "running"] else 3
-                )
-                folium.PolyLine(
-                    locations=coordinates,
-                    popup=popup_content,
-                    tooltip=name,
-                    color=colors["color"],
-                    weight=weight,
-                    opacity=0.8,
-                ).add_to(feature_group)
+                weight = 4 if area_type in self._TRAIL_TYPES else 3
+                geometry = {"type": "LineString", "coordinates": coordinates}
+                style = {"color": colors["color"], "weight": weight, "opacity": 0.8}
 
         elif area["type"] == "node":
-            # Handle node geometries (points)
-            folium.Marker(
-                location=[area["lat"], area["lon"]],
-                popup=popup_content,
-                tooltip=name,
-                icon=folium.Icon(
-                    color=colors["color"], icon=colors["icon"], prefix="fa"
-                ),
-            ).add_to(feature_group)
+            # Handle node geometries (points), rendered with the layer's marker
+            geometry = {"type": "Point", "coordinates": [area["lon"], area["lat"]]}
+            style = {}
+
+        else:
+            return
+
+        features.append(
+            {
+                "type": "Feature",
+                "geometry": geometry,
+                "properties": {"name": name, "popup": popup_content, "style": style},
+            }
+        )
 
 
 def main():
@@ -470,8 +764,8 @@ def main():
     ]
 
     # Calculate center for map
-    center_lat = sum(coord[0] for coord in corners) / len(corners)
-    center_lon = sum(coord[1] for coord in corners) / len(corners)
+    corners_arr = np.asarray(corners, dtype=np.float64)
+    center_lat, center_lon = corners_arr.mean(axis=0)
 
     # Create enhanced map with multiple tile options
     search_map = folium.Map(location=[center_lat, center_lon], zoom_start=14)
@@ -507,7 +801,7 @@ def main():
             subprocess.check_call([sys.executable, "-m", "pip", "install", "shapely"])
             from shapely.geometry import Point, Polygon as ShapelyPolygon
 
-        public_areas_overlay = WedgePublicAreasOverlay(corners)
+        public_areas_overlay = WedgePublicAreasOverlay(corners_arr)
         search_map = public_areas_overlay.add_to_map(search_map)
 
     except Exception as e:
@@ -3,8 +3,43 @@
 Find the 4 corner coordinates where Day 15 cuts into Day 18 wedge area
 """
 
-import math
-from shapely.geometry import LineString, Point
+import numpy as np
+
+# Miles per degree of latitude (longitude degrees shrink by cos(latitude))
+MILES_PER_DEG_LAT = 69.0
+
+
+def segment_lengths_miles(starts, ends):
+    """Length in miles of each [lat, lon] segment, with cos(lat) longitude scaling."""
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    mid_lat = np.deg2rad((starts[..., 0] + ends[..., 0]) / 2)
+    d_lat = (ends[..., 0] - starts[..., 0]) * MILES_PER_DEG_LAT
+    d_lon = (ends[..., 1] - starts[..., 1]) * MILES_PER_DEG_LAT * np.cos(mid_lat)
+    return np.hypot(d_lat, d_lon)
+
+
+def segment_intersections(a_starts, a_ends, b_starts, b_ends):
+    """
+    Intersect segment pairs a[i] x b[i] using the closed-form 2x2 determinant.
+
+    Returns:
+        (points, valid): (N, 2) intersection points and a mask of the pairs whose
+        segments actually cross (parallel or non-overlapping pairs are False)
+    """
+    p1, p2 = np.asarray(a_starts, np.float64), np.asarray(a_ends, np.float64)
+    p3, p4 = np.asarray(b_starts, np.float64), np.asarray(b_ends, np.float64)
+    d12, d34, d13 = p1 - p2, p3 - p4, p1 - p3
+
+    det = d12[:, 0] * d34[:, 1] - d12[:, 1] * d34[:, 0]
+    parallel = det == 0
+    det = np.where(parallel, 1.0, det)
+    t = (d13[:, 0] * d34[:, 1] - d13[:, 1] * d34[:, 0]) / det
+    u = (d13[:, 0] * d12[:, 1] - d13[:, 1] * d12[:, 0]) / det
+
+    points = p1 + t[:, None] * (p2 - p1)
+    valid = ~parallel & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+    return points, valid
 
 
 def main():
@@ -51,41 +86,15 @@ def main():
     print(f"  Right line: {day15_right_line[0]} -> {day15_right_line[1]}")
     print(f"  Center line: {day15_center_line[0]} -> {day15_center_line[1]}")
 
-    # Calculate distance in degrees (rough approximation)
-    def distance_between_points(p1, p2):
-        lat_diff = p2[0] - p1[0]
-        lon_diff = p2[1] - p1[1]
-        return math.sqrt(lat_diff**2 + lon_diff**2)
-
     # Find points at 4 miles along Day 18 boundaries
-    # 4 miles ≈ 0.058 degrees at this latitude
-    miles_to_degrees = 0.0145  # Rough conversion for this area
-    four_miles_deg = 4 * miles_to_degrees
-
-    def point_along_line(start, end, distance_ratio):
-        """Find a point along a line at a specific distance ratio (0-1)"""
-        lat = start[0] + (end[0] - start[0]) * distance_ratio
-        lon = start[1] + (end[1] - start[1]) * distance_ratio
-        return [lat, lon]
-
-    # Calculate total distance of Day 18 lines
-    day18_left_total_dist = distance_between_points(
-        day18_left_line[0], day18_left_line[1]
-    )
-    day18_right_total_dist = distance_between_points(
-        day18_right_line[0], day18_right_line[1]
-    )
-
-    # Find 4-mile points along Day 18 boundaries
-    four_mile_ratio_left = four_miles_deg / day18_left_total_dist
-    four_mile_ratio_right = four_miles_deg / day18_right_total_dist
-
-    day18_left_4mile = point_along_line(
-        day18_left_line[0], day18_left_line[1], four_mile_ratio_left
-    )
-    day18_right_4mile = point_along_line(
-        day18_right_line[0], day18_right_line[1], four_mile_ratio_right
+    four_miles = 4.0
+    day18_lines = np.array([day18_left_line, day18_right_line], dtype=np.float64)
+    day18_lengths = segment_lengths_miles(day18_lines[:, 0], day18_lines[:, 1])
+    ratios = four_miles / day18_lengths
+    four_mile_points = day18_lines[:, 0] + ratios[:, None] * (
+        day18_lines[:, 1] - day18_lines[:, 0]
     )
+    day18_left_4mile, day18_right_4mile = four_mile_points.tolist()
 
     print(f"\nDay 18 inner boundary (4-mile mark):")
     print(
@@ -95,46 +104,24 @@ def main():
         f"  Right side at 4 miles: [{day18_right_4mile[0]:.8f}, {day18_right_4mile[1]:.8f}]"
     )
 
-    # Create LineString objects for intersection calculations
-    day15_left_linestring = LineString(day15_left_line)
-    day15_right_linestring = LineString(day15_right_line)
-    day18_left_linestring = LineString(day18_left_line)
-    day18_right_linestring = LineString(day18_right_line)
+    # Find intersections between Day 15 boundaries and Day 18 boundaries,
+    # all four pairings solved in one vectorized call
+    pairs = [
+        ("Day 15 left ∩ Day 18 left", day15_left_line, day18_left_line),
+        ("Day 15 left ∩ Day 18 right", day15_left_line, day18_right_line),
+        ("Day 15 right ∩ Day 18 left", day15_right_line, day18_left_line),
+        ("Day 15 right ∩ Day 18 right", day15_right_line, day18_right_line),
+    ]
+    segments = np.array([[a, b] for _, a, b in pairs], dtype=np.float64)
+    points, valid = segment_intersections(
+        segments[:, 0, 0], segments[:, 0, 1], segments[:, 1, 0], segments[:, 1, 1]
+    )
 
-    # Find intersections between Day 15 boundaries and Day 18 boundaries
     intersections = []
-
-    # Check Day 15 left line intersecting Day 18 left line
-    intersection1 = day15_left_linestring.intersection(day18_left_linestring)
-    if not intersection1.is_empty and hasattr(intersection1, "x"):
-        intersections.append([intersection1.y, intersection1.x])
-        print(
-            f"Day 15 left ∩ Day 18 left: [{intersection1.y:.8f}, {intersection1.x:.8f}]"
-        )
-
-    # Check Day 15 left line intersecting Day 18 right line
-    intersection2 = day15_left_linestring.intersection(day18_right_linestring)
-    if not intersection2.is_empty and hasattr(intersection2, "x"):
-        intersections.append([intersection2.y, intersection2.x])
-        print(
-            f"Day 15 left ∩ Day 18 right: [{intersection2.y:.8f}, {intersection2.x:.8f}]"
-        )
-
-    # Check Day 15 right line intersecting Day 18 left line
-    intersection3 = day15_right_linestring.intersection(day18_left_linestring)
-    if not intersection3.is_empty and hasattr(intersection3, "x"):
-        intersections.append([intersection3.y, intersection3.x])
-        print(
-            f"Day 15 right ∩ Day 18 left: [{intersection3.y:.8f}, {intersection3.x:.8f}]"
-        )
-
-    # Check Day 15 right line intersecting Day 18 right line
-    intersection4 = day15_right_linestring.intersection(day18_right_linestring)
-    if not intersection4.is_empty and hasattr(intersection4, "x"):
-        intersections.append([intersection4.y, intersection4.x])
-        print(
-            f"Day 15 right ∩ Day 18 right: [{intersection4.y:.8f}, {intersection4.x:.8f}]"
-        )
+    for (label, _, _), point, ok in zip(pairs, points, valid):
+        if ok:
+            intersections.append(point.tolist())
+            print(f"{label}: [{point[0]:.8f}, {point[1]:.8f}]")
 
     print(f"\nFound {len(intersections)} boundary intersections")
 
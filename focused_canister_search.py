@@ -7,14 +7,51 @@ within or near the wedge that match the story criteria.
 
 import folium
 import json
+from folium.plugins import MarkerCluster
+import numpy as np
+from dataclasses import dataclass
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Wedge search area corners (read-only (4, 2) [lat, lon] array)
+wedge_corners = np.array(
+    [
+        [40.49258082, -74.57854107],  # Corner 1: Day 18 Left (4-mile)
+        [40.50053426, -74.56162256],  # Corner 2: Day 18 Right (4-mile)
+        [40.52752728, -74.57756772],  # Corner 3: Day 15 cuts Day 18 (N)
+        [40.51608736, -74.60373849],  # Corner 4: Day 15 cuts Day 18 (W)
+    ],
+    dtype=np.float64,
+)
+wedge_corners.setflags(write=False)
+
+
+@dataclass(frozen=True, slots=True)
+class Location:
+    """Public access location that could contain the canister."""
+
+    name: str
+    lat: float
+    lon: float
+    reason: str
+    confidence: str
+
+
+@dataclass(frozen=True, slots=True)
+class SearchTarget:
+    """Story-based target zone searched within a fixed radius (meters)."""
+
+    name: str
+    lat: float
+    lon: float
+    reason: str
+    search_radius: int
 
-# Wedge search area corners
-wedge_corners = [
-    [40.49258082, -74.57854107],  # Corner 1: Day 18 Left (4-mile)
-    [40.50053426, -74.56162256],  # Corner 2: Day 18 Right (4-mile)
-    [40.52752728, -74.57756772],  # Corner 3: Day 15 cuts Day 18 (N)
-    [40.51608736, -74.60373849],  # Corner 4: Day 15 cuts Day 18 (W)
-]
 
 # Day 16 anomaly location
 anomaly_location = [41.473666, -74.660742]
@@ -22,83 +59,99 @@ anomaly_location = [41.473666, -74.660742]
 # Based on story analysis and local geography, identify most probable locations
 # These are public, wooded areas that could realistically contain the canister
 probable_locations = [
-    {
-        "name": "Mercer County Park System - North",
-        "lat": 40.5180,
-        "lon": -74.5950,
-        "reason": "Large wooded park system, multiple hiking trails, easily accessible",
-        "confidence": "High",
-    },
-    {
-        "name": "Baldpate Mountain - Hopewell",
-        "lat": 40.5050,
-        "lon": -74.5800,
-        "reason": "Wooded hiking area, part of park system, matches terrain description",
-        "confidence": "High",
-    },
-    {
-        "name": "Princeton Battlefield State Park",
-        "lat": 40.5020,
-        "lon": -74.5650,
-        "reason": "Historic park with wooded areas, hiking trails, public access",
-        "confidence": "Medium",
-    },
-    {
-        "name": "Lawrence Hopewell Trail System",
-        "lat": 40.5100,
-        "lon": -74.5750,
-        "reason": "Trail system through wooded areas, popular hiking destination",
-        "confidence": "Medium",
-    },
-    {
-        "name": "Rosedale Park",
-        "lat": 40.5140,
-        "lon": -74.5620,
-        "reason": "Local park with wooded sections, less trafficked areas",
-        "confidence": "Medium",
-    },
+    Location(
+        name="Mercer County Park System - North",
+        lat=40.5180,
+        lon=-74.5950,
+        reason="Large wooded park system, multiple hiking trails, easily accessible",
+        confidence="High",
+    ),
+    Location(
+        name="Baldpate Mountain - Hopewell",
+        lat=40.5050,
+        lon=-74.5800,
+        reason="Wooded hiking area, part of park system, matches terrain description",
+        confidence="High",
+    ),
+    Location(
+        name="Princeton Battlefield State Park",
+        lat=40.5020,
+        lon=-74.5650,
+        reason="Historic park with wooded areas, hiking trails, public access",
+        confidence="Medium",
+    ),
+    Location(
+        name="Lawrence Hopewell Trail System",
+        lat=40.5100,
+        lon=-74.5750,
+        reason="Trail system through wooded areas, popular hiking destination",
+        confidence="Medium",
+    ),
+    Location(
+        name="Rosedale Park",
+        lat=40.5140,
+        lon=-74.5620,
+        reason="Local park with wooded sections, less trafficked areas",
+        confidence="Medium",
+    ),
 ]
 
 # Story-based target criteria locations (within wedge that match description)
 story_targets = [
-    {
-        "name": "Target Zone A - Central Wedge",
-        "lat": 40.5100,
-        "lon": -74.5750,
-        "reason": "Central location in wedge, likely wooded residential area transitions",
-        "search_radius": 500,
-    },
-    {
-        "name": "Target Zone B - Northwest Wedge",
-        "lat": 40.5200,
-        "lon": -74.5900,
-        "reason": "Near wedge boundary, potential park or preserve areas",
-        "search_radius": 750,
-    },
-    {
-        "name": "Target Zone C - Eastern Wedge",
-        "lat": 40.5050,
-        "lon": -74.5650,
-        "reason": "Eastern section, near potential trail systems",
-        "search_radius": 500,
-    },
+    SearchTarget(
+        name="Target Zone A - Central Wedge",
+        lat=40.5100,
+        lon=-74.5750,
+        reason="Central location in wedge, likely wooded residential area transitions",
+        search_radius=500,
+    ),
+    SearchTarget(
+        name="Target Zone B - Northwest Wedge",
+        lat=40.5200,
+        lon=-74.5900,
+        reason="Near wedge boundary, potential park or preserve areas",
+        search_radius=750,
+    ),
+    SearchTarget(
+        name="Target Zone C - Eastern Wedge",
+        lat=40.5050,
+        lon=-74.5650,
+        reason="Eastern section, near potential trail systems",
+        search_radius=500,
+    ),
 ]
 
+# Coordinates of the locations above as read-only (N, 2) [lat, lon] arrays,
+# row-aligned with the metadata records
+probable_latlons = np.array(
+    [(location.lat, location.lon) for location in probable_locations],
+    dtype=np.float64,
+)
+probable_latlons.setflags(write=False)
+target_latlons = np.array(
+    [(target.lat, target.lon) for target in story_targets], dtype=np.float64
+)
+target_latlons.setflags(write=False)
+
 
 def create_focused_search_map():
     """Create focused search map highlighting most probable locations"""
 
     # Center on wedge area
-    center_lat = sum(corner[0] for corner in wedge_corners) / len(wedge_corners)
-    center_lon = sum(corner[1] for corner in wedge_corners) / len(wedge_corners)
+    center_lat, center_lon = wedge_corners.mean(axis=0).tolist()
 
+    # Canvas renderer: the overlapping search-radius circles are painted on one
+    # canvas instead of one SVG node each
     m = folium.Map(
-        location=[center_lat, center_lon], zoom_start=13, tiles="OpenStreetMap"
+        location=[center_lat, center_lon],
+        zoom_start=13,
+        tiles="OpenStreetMap",
+        prefer_canvas=True,
     )
 
     # Add wedge search area - primary focus
     folium.Polygon(
-        locations=wedge_corners,
+        locations=wedge_corners.tolist(),
         color="blue",
         weight=4,
         fillColor="lightblue",
@@ -113,42 +166,48 @@ def create_focused_search_map():
         icon=folium.Icon(color="red", icon="exclamation-triangle", prefix="fa"),
     ).add_to(m)
 
-    # Add probable public access locations
-    for location in probable_locations:
-        color = "green" if location["confidence"] == "High" else "orange"
+    # Add probable public access locations: markers are clustered, their search
+    # radii go in a separate (canvas-rendered) layer
+    location_cluster = MarkerCluster(name="Probable Locations")
+    location_radii = folium.FeatureGroup(name="Probable Location Radii")
+    for location, latlon in zip(probable_locations, probable_latlons.tolist()):
+        color = "green" if location.confidence == "High" else "orange"
 
         folium.Marker(
-            [location["lat"], location["lon"]],
-            popup=f"<b>{location['name']}</b><br>{location['reason']}<br>Confidence: {location['confidence']}",
+            latlon,
+            popup=f"<b>{location.name}</b><br>{location.reason}<br>Confidence: {location.confidence}",
             icon=folium.Icon(color=color, icon="tree", prefix="fa"),
-        ).add_to(m)
+        ).add_to(location_cluster)
 
         # Add search radius
-        radius = 400 if location["confidence"] == "High" else 300
+        radius = 400 if location.confidence == "High" else 300
         folium.Circle(
-            location=[location["lat"], location["lon"]],
+            location=latlon,
             radius=radius,
             color=color,
             fillColor=color,
             fillOpacity=0.2,
-            popup=f"{location['name']}<br>{radius}m search area",
-        ).add_to(m)
+            popup=f"{location.name}<br>{radius}m search area",
+        ).add_to(location_radii)
+
+    location_radii.add_to(m)
+    location_cluster.add_to(m)
 
     # Add story-based target zones within wedge
-    for target in story_targets:
+    for target, latlon in zip(story_targets, target_latlons.tolist()):
         folium.Marker(
-            [target["lat"], target["lon"]],
-            popup=f"<b>{target['name']}</b><br>{target['reason']}",
+            latlon,
+            popup=f"<b>{target.name}</b><br>{target.reason}",
             icon=folium.Icon(color="purple", icon="bullseye", prefix="fa"),
         ).add_to(m)
 
         folium.Circle(
-            location=[target["lat"], target["lon"]],
-            radius=target["search_radius"],
+            location=latlon,
+            radius=target.search_radius,
             color="purple",
             fillColor="purple",
             fillOpacity=0.15,
-            popup=f"{target['name']}<br>{target['search_radius']}m zone",
+            popup=f"{target.name}<br>{target.search_radius}m zone",
         ).add_to(m)
 
     # Add satellite imagery layer
@@ -243,8 +302,12 @@ def main():
         print(f"   • {timing}")
 
     # Save recommendations
-    with open("search_recommendations.json", "w") as f:
-        json.dump(recommendations, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open("search_recommendations.json", "wb") as f:
+            f.write(orjson.dumps(recommendations, option=orjson.OPT_INDENT_2))
+    else:
+        with open("search_recommendations.json", "w") as f:
+            json.dump(recommendations, f, indent=2)
     print(f"\n✓ Detailed recommendations saved: search_recommendations.json")
 
     print(f"\n=== SUMMARY ===")
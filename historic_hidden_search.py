@@ -12,9 +12,238 @@ Specifically designed to find:
 - Areas perfect for hiding items away from casual discovery
 """
 
-import folium
-import requests
-from public_areas import PublicAreasOverlay
+import gzip
+import hashlib
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+# folium, numpy, requests and shapely (and public_areas, which pulls in
+# folium) are imported inside the functions that use them, so importing this
+# module for classify_historic_element/tag_signature stays cheap
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_loads(data):
+    """Parse JSON bytes, with orjson's C parser when it is installed."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _json_dumps(obj):
+    """Serialize to UTF-8 JSON bytes, with orjson when it is installed."""
+    return orjson.dumps(obj) if ORJSON_AVAILABLE else json.dumps(obj).encode("utf-8")
+
+
+# Overpass API endpoint
+OVERPASS_URL = "https://overpass-api.de/api/interpreter"
+
+# The search bbox is split into TILE_GRID x TILE_GRID sub-queries, fetched
+# concurrently. Overpass allows only a couple of parallel slots per client IP,
+# so keep MAX_PARALLEL_REQUESTS low.
+TILE_GRID = 2
+MAX_PARALLEL_REQUESTS = 2
+
+
+@lru_cache(maxsize=None)
+def _session():
+    """
+    Shared HTTP session, created on first use: the tile requests reuse pooled
+    keep-alive connections to Overpass instead of a new TCP+TLS handshake each.
+    """
+    import requests
+
+    session = requests.Session()
+    session.headers.update(
+        {"Accept-Encoding": "gzip, deflate", "User-Agent": "hidden-search/1.0"}
+    )
+    return session
+
+
+# Tile responses are cached on disk, keyed by a hash of the (bbox-specific)
+# query text, so reruns over the same wedge skip the Overpass round-trip
+CACHE_DIR = Path.home() / ".cache" / "historic_overpass"
+CACHE_MAX_AGE = 7 * 86400  # seconds
+
+# Way geometries are simplified (degrees, ~11 m) and rounded (~1 m) before
+# rendering; visually identical at the zoom levels these maps are used at
+SIMPLIFY_TOLERANCE = 1e-4
+COORDINATE_DECIMALS = 5
+
+# Categories whose unnamed point markers are skipped when rendering
+LOW_SIGNAL_UNNAMED = frozenset({"old_infrastructure", "abandoned_areas"})
+
+# Tag values used by tag_signature
+HISTORIC_SITE_TAGS = frozenset(
+    {"archaeological_site", "battlefield", "castle", "fort", "manor"}
+)
+MEMORIAL_TAGS = frozenset({"memorial", "monument"})
+NATURAL_HIDING_TAGS = frozenset({"cave", "rock"})
+
+# Free-text tags (plus any "name:<lang>") whose values are not searched for
+# abandoned/ruins/mine keywords: "Ruins Cafe" or "Minerva Park" say nothing
+# about the feature itself
+FREE_TEXT_KEYS = frozenset(
+    {
+        "name",
+        "alt_name",
+        "old_name",
+        "official_name",
+        "short_name",
+        "description",
+        "note",
+        "inscription",
+    }
+)
+
+# Classification predicate bits, see tag_signature
+BIT_HORSE_TRACK = 1 << 0
+BIT_HISTORIC_SITE = 1 << 1
+BIT_ABANDONED = 1 << 2
+BIT_RUINS = 1 << 3
+BIT_MEMORIAL = 1 << 4
+BIT_CEMETERY = 1 << 5
+BIT_MILITARY = 1 << 6
+BIT_MINE = 1 << 7
+BIT_NATURAL = 1 << 8
+BIT_OLD_INFRASTRUCTURE = 1 << 9
+
+# Category for each predicate bit, in classification priority order
+CATEGORY_BY_BIT = (
+    (BIT_HORSE_TRACK, "horse_tracks"),
+    (BIT_HISTORIC_SITE, "historic_sites"),
+    (BIT_ABANDONED, "abandoned_areas"),
+    (BIT_RUINS, "ruins"),
+    (BIT_MEMORIAL, "memorials"),
+    (BIT_CEMETERY, "cemeteries"),
+    (BIT_MILITARY, "military"),
+    (BIT_MINE, "mines_quarries"),
+    (BIT_NATURAL, "caves_rocks"),
+    (BIT_OLD_INFRASTRUCTURE, "old_infrastructure"),
+)
+
+# Horse/racing track or Sullivan names, matched against the lowercased name
+_HORSE_TRACK_RE = re.compile(r"horse.*track|track.*horse|sullivan")
+
+# Comprehensive query for historic and abandoned features
+HISTORIC_QUERY_TEMPLATE = """
+[out:json][timeout:60];
+(
+  // Historic sites and landmarks
+  way["historic"]({south},{west},{north},{east});
+  node["historic"]({south},{west},{north},{east});
+  relation["historic"]({south},{west},{north},{east});
+
+  // Abandoned and disused areas
+  way["abandoned"]({south},{west},{north},{east});
+  node["abandoned"]({south},{west},{north},{east});
+  way["disused"]({south},{west},{north},{east});
+  node["disused"]({south},{west},{north},{east});
+
+  // Ruins and archaeological sites
+  way["ruins"="yes"]({south},{west},{north},{east});
+  node["ruins"="yes"]({south},{west},{north},{east});
+  way["archaeological_site"]({south},{west},{north},{east});
+  node["archaeological_site"]({south},{west},{north},{east});
+
+  // Old infrastructure
+  way["railway"="abandoned"]({south},{west},{north},{east});
+  way["highway"="track"]["access"="private"]({south},{west},{north},{east});
+  way["man_made"="ruins"]({south},{west},{north},{east});
+
+  // Memorials and monuments (often secluded)
+  way["historic"="memorial"]({south},{west},{north},{east});
+  node["historic"="memorial"]({south},{west},{north},{east});
+  way["historic"="monument"]({south},{west},{north},{east});
+  node["historic"="monument"]({south},{west},{north},{east});
+
+  // Cemeteries (historic and secluded areas)
+  way["landuse"="cemetery"]({south},{west},{north},{east});
+  way["amenity"="grave_yard"]({south},{west},{north},{east});
+
+  // Quarries and mines (often abandoned/historic)
+  way["landuse"="quarry"]({south},{west},{north},{east});
+  way["man_made"="mine"]({south},{west},{north},{east});
+  node["man_made"="mine_shaft"]({south},{west},{north},{east});
+
+  // Old military sites
+  way["military"="bunker"]({south},{west},{north},{east});
+  node["military"="bunker"]({south},{west},{north},{east});
+  way["historic"="fort"]({south},{west},{north},{east});
+
+  // Specific search for horse/racing tracks
+  way["leisure"="horse_riding"]({south},{west},{north},{east});
+  way["sport"="horse_racing"]({south},{west},{north},{east});
+  way["leisure"="track"]["sport"="horse_racing"]({south},{west},{north},{east});
+  node["name"~"[Hh]orse.*[Tt]rack"]({south},{west},{north},{east});
+  node["name"~"Sullivan"]({south},{west},{north},{east});
+
+  // Old foundations and structures
+  way["building"="ruins"]({south},{west},{north},{east});
+  node["ruins"="building"]({south},{west},{north},{east});
+
+  // Secluded natural features
+  way["natural"="cave"]({south},{west},{north},{east});
+  node["natural"="cave"]({south},{west},{north},{east});
+  way["natural"="rock"]({south},{west},{north},{east});
+  node["natural"="rock"]({south},{west},{north},{east});
+);
+out geom;
+"""
+
+
+def split_bounds(bounds, grid=TILE_GRID):
+    """
+    Split a (south, west, north, east) bbox into a grid x grid list of sub-bboxes.
+    """
+    south, west, north, east = bounds
+    lat_step = (north - south) / grid
+    lon_step = (east - west) / grid
+    return [
+        (
+            south + i * lat_step,
+            west + j * lon_step,
+            south + (i + 1) * lat_step,
+            west + (j + 1) * lon_step,
+        )
+        for i in range(grid)
+        for j in range(grid)
+    ]
+
+
+def fetch_historic_elements(bounds):
+    """Run the historic/hidden Overpass query for one bbox and return its elements."""
+    south, west, north, east = bounds
+    query = HISTORIC_QUERY_TEMPLATE.format(
+        south=south, west=west, north=north, east=east
+    )
+    cache_key = hashlib.sha1(query.encode("utf-8")).hexdigest()
+    cache_file = CACHE_DIR / f"{cache_key}.json.gz"
+    try:
+        if time.time() - cache_file.stat().st_mtime < CACHE_MAX_AGE:
+            with gzip.open(cache_file, "rb") as f:
+                return _json_loads(f.read())
+    except (OSError, ValueError):
+        pass  # missing, stale or unreadable cache entry - refetch
+
+    response = _session().post(OVERPASS_URL, data=query, timeout=60)
+    response.raise_for_status()
+    elements = _json_loads(response.content).get("elements", [])
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix(".partial")
+    with gzip.open(tmp_file, "wb") as f:
+        f.write(_json_dumps(elements))
+    tmp_file.replace(cache_file)
+    return elements
 
 
 def get_historic_and_hidden_areas(bounds):
@@ -27,81 +256,22 @@ def get_historic_and_hidden_areas(bounds):
     Returns:
         Dictionary with categorized historic and hidden locations
     """
-    south, west, north, east = bounds
-
-    # Comprehensive query for historic and abandoned features
-    query = f"""
-    [out:json][timeout:60];
-    (
-      // Historic sites and landmarks
-      way["historic"]({south},{west},{north},{east});
-      node["historic"]({south},{west},{north},{east});
-      relation["historic"]({south},{west},{north},{east});
-      
-      // Abandoned and disused areas
-      way["abandoned"]({south},{west},{north},{east});
-      node["abandoned"]({south},{west},{north},{east});
-      way["disused"]({south},{west},{north},{east});
-      node["disused"]({south},{west},{north},{east});
-      
-      // Ruins and archaeological sites
-      way["ruins"="yes"]({south},{west},{north},{east});
-      node["ruins"="yes"]({south},{west},{north},{east});
-      way["archaeological_site"]({south},{west},{north},{east});
-      node["archaeological_site"]({south},{west},{north},{east});
-      
-      // Old infrastructure
-      way["railway"="abandoned"]({south},{west},{north},{east});
-      way["highway"="track"]["access"="private"]({south},{west},{north},{east});
-      way["man_made"="ruins"]({south},{west},{north},{east});
-      
-      // Memorials and monuments (often secluded)
-      way["historic"="memorial"]({south},{west},{north},{east});
-      node["historic"="memorial"]({south},{west},{north},{east});
-      way["historic"="monument"]({south},{west},{north},{east});
-      node["historic"="monument"]({south},{west},{north},{east});
-      
-      // Cemeteries (historic and secluded areas)
-      way["landuse"="cemetery"]({south},{west},{north},{east});
-      way["amenity"="grave_yard"]({south},{west},{north},{east});
-      
-      // Quarries and mines (often abandoned/historic)
-      way["landuse"="quarry"]({south},{west},{north},{east});
-      way["man_made"="mine"]({south},{west},{north},{east});
-      node["man_made"="mine_shaft"]({south},{west},{north},{east});
-      
-      // Old military sites
-      way["military"="bunker"]({south},{west},{north},{east});
-      node["military"="bunker"]({south},{west},{north},{east});
-      way["historic"="fort"]({south},{west},{north},{east});
-      
-      // Specific search for horse/racing tracks
-      way["leisure"="horse_riding"]({south},{west},{north},{east});
-      way["sport"="horse_racing"]({south},{west},{north},{east});
-      way["leisure"="track"]["sport"="horse_racing"]({south},{west},{north},{east});
-      node["name"~"[Hh]orse.*[Tt]rack"]({south},{west},{north},{east});
-      node["name"~"Sullivan"]({south},{west},{north},{east});
-      
-      // Old foundations and structures
-      way["building"="ruins"]({south},{west},{north},{east});
-      node["ruins"="building"]({south},{west},{north},{east});
-      
-      // Secluded natural features
-      way["natural"="cave"]({south},{west},{north},{east});
-      node["natural"="cave"]({south},{west},{north},{east});
-      way["natural"="rock"]({south},{west},{north},{east});
-      node["natural"="rock"]({south},{west},{north},{east});
-    );
-    out geom;
-    """
-
     try:
         print("🔍 Searching for historic sites and hidden locations...")
-        response = requests.post(
-            "https://overpass-api.de/api/interpreter", data=query, timeout=60
-        )
-        response.raise_for_status()
-        data = response.json()
+        tiles = split_bounds(bounds)
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+            tile_elements = list(executor.map(fetch_historic_elements, tiles))
+
+        # Features crossing tile edges are returned by several tiles
+        elements = []
+        seen = set()
+        for batch in tile_elements:
+            for element in batch:
+                key = (element["type"], element["id"])
+                if key not in seen:
+                    seen.add(key)
+                    element["_sig"] = tag_signature(element.get("tags", {}))
+                    elements.append(element)
 
         # Categorize the findings
         categories = {
@@ -117,7 +287,7 @@ def get_historic_and_hidden_areas(bounds):
             "old_infrastructure": [],
         }
 
-        for element in data.get("elements", []):
+        for element in elements:
             category = classify_historic_element(element)
             if category in categories:
                 categories[category].append(element)
@@ -143,74 +313,156 @@ def get_historic_and_hidden_areas(bounds):
         }
 
 
-def classify_historic_element(element):
-    """Classify historic elements into hiding spot categories."""
-    tags = element.get("tags", {})
-    name = tags.get("name", "").lower()
+def simplify_coordinates(coordinates, closed):
+    """
+    Ramer-Douglas-Peucker simplify a list of [lon, lat] coordinates and round
+    them to COORDINATE_DECIMALS. Falls back to the rounded input when the
+    simplified shape would collapse.
+    """
+    from shapely.geometry import LineString, Polygon
 
-    # Check for horse tracks specifically
-    if (
-        ("horse" in name and "track" in name)
-        or tags.get("sport") == "horse_racing"
-        or "sullivan" in name
+    if closed:
+        simplified = Polygon(coordinates).simplify(SIMPLIFY_TOLERANCE)
+        coords = [] if simplified.is_empty else simplified.exterior.coords
+        min_points = 4
+    else:
+        simplified = LineString(coordinates).simplify(
+            SIMPLIFY_TOLERANCE, preserve_topology=False
+        )
+        coords = simplified.coords
+        min_points = 2
+
+    if len(coords) < min_points:
+        coords = coordinates
+    return [
+        [round(lon, COORDINATE_DECIMALS), round(lat, COORDINATE_DECIMALS)]
+        for lon, lat in coords
+    ]
+
+
+def tag_signature(tags):
+    """
+    Fold every classification predicate for an element's tags into one bitmask.
+
+    The tag dict is scanned once for the substring checks (abandoned, ruins,
+    mines), which look inside every key and every structural value, so e.g.
+    man_made=mineshaft and resource=minerals count as mines. Free-text values
+    (names, descriptions, notes) are skipped. The remaining checks are single
+    dict lookups.
+
+    >>> tag_signature({"name": "abandoned_dreams"}) & BIT_ABANDONED
+    0
+    >>> tag_signature({"building": "abandoned"}) & BIT_ABANDONED == BIT_ABANDONED
+    True
+    """
+    sig = 0
+    for key, value in tags.items():
+        if key in FREE_TEXT_KEYS or key.startswith("name:"):
+            value = ""
+        if (
+            "abandoned" in key
+            or "disused" in key
+            or "abandoned" in value
+            or "disused" in value
+        ):
+            sig |= BIT_ABANDONED
+        if "ruins" in key or "ruins" in value:
+            sig |= BIT_RUINS
+        if "mine" in key or "mine" in value:
+            sig |= BIT_MINE
+
+    historic = tags.get("historic")
+    landuse = tags.get("landuse")
+    if tags.get("sport") == "horse_racing" or _HORSE_TRACK_RE.search(
+        tags.get("name", "").lower()
     ):
-        return "horse_tracks"
-
-    # Historic sites
-    elif tags.get("historic") in [
-        "archaeological_site",
-        "battlefield",
-        "castle",
-        "fort",
-        "manor",
-    ]:
-        return "historic_sites"
-
-    # Abandoned/disused
-    elif "abandoned" in str(tags) or "disused" in str(tags):
-        return "abandoned_areas"
-
-    # Ruins
-    elif (
-        tags.get("ruins") == "yes"
-        or tags.get("historic") == "ruins"
-        or "ruins" in str(tags)
+        sig |= BIT_HORSE_TRACK
+    if historic in HISTORIC_SITE_TAGS:
+        sig |= BIT_HISTORIC_SITE
+    if historic in MEMORIAL_TAGS:
+        sig |= BIT_MEMORIAL
+    if landuse == "cemetery" or tags.get("amenity") == "grave_yard":
+        sig |= BIT_CEMETERY
+    if tags.get("military") or historic == "fort":
+        sig |= BIT_MILITARY
+    if landuse == "quarry":
+        sig |= BIT_MINE
+    if tags.get("natural") in NATURAL_HIDING_TAGS:
+        sig |= BIT_NATURAL
+    if tags.get("railway") == "abandoned" or (
+        tags.get("highway") == "track" and tags.get("access") == "private"
     ):
-        return "ruins"
+        sig |= BIT_OLD_INFRASTRUCTURE
+    return sig
 
-    # Memorials and monuments
-    elif tags.get("historic") in ["memorial", "monument"]:
-        return "memorials"
 
-    # Cemeteries
-    elif tags.get("landuse") == "cemetery" or tags.get("amenity") == "grave_yard":
-        return "cemeteries"
+def classify_historic_element(element):
+    """Classify historic elements into hiding spot categories."""
+    sig = element.get("_sig")
+    if sig is None:
+        sig = tag_signature(element.get("tags", {}))
 
-    # Military sites
-    elif tags.get("military") or tags.get("historic") == "fort":
-        return "military"
+    # First matching bit in priority order wins
+    for bit, category in CATEGORY_BY_BIT:
+        if sig & bit:
+            return category
+    return "historic_sites"
 
-    # Mines and quarries
-    elif tags.get("landuse") == "quarry" or "mine" in str(tags):
-        return "mines_quarries"
 
-    # Natural hiding spots
-    elif tags.get("natural") in ["cave", "rock"]:
-        return "caves_rocks"
+def element_geometry(element):
+    """Shapely (lon, lat) geometry of a node or way element, or None."""
+    from shapely.geometry import LineString, Point
 
-    # Old infrastructure
-    elif tags.get("railway") == "abandoned" or (
-        tags.get("highway") == "track" and tags.get("access") == "private"
-    ):
-        return "old_infrastructure"
+    if element["type"] == "node":
+        return Point(element["lon"], element["lat"])
+    if element["type"] == "way" and element.get("geometry"):
+        coords = [(node["lon"], node["lat"]) for node in element["geometry"]]
+        return LineString(coords) if len(coords) > 1 else Point(coords[0])
+    return None
 
-    else:
-        return "historic_sites"
 
+def filter_to_wedge(historic_data, corners):
+    """
+    Keep only the elements that intersect the wedge quadrilateral.
+
+    Overpass answers for the axis-aligned bbox around the wedge; ways are kept
+    when any part of them crosses the wedge, not just their vertices.
 
-def add_historic_overlay(map_obj, bounds):
-    """Add historic and hidden location overlay to the map."""
+    Args:
+        historic_data: Dictionary of category -> elements
+        corners: Wedge corners as [lat, lon] pairs
+
+    Returns:
+        Dictionary with the same categories, filtered to the wedge
+    """
+    import numpy as np
+    from shapely.geometry import Polygon
+    from shapely.strtree import STRtree
+
+    wedge = Polygon([(lon, lat) for lat, lon in corners])
+    filtered = {}
+    for category, items in historic_data.items():
+        indexed = [(item, element_geometry(item)) for item in items]
+        indexed = [(item, geom) for item, geom in indexed if geom is not None]
+        if not indexed:
+            filtered[category] = []
+            continue
+        tree = STRtree([geom for _, geom in indexed])
+        hits = np.sort(tree.query(wedge, predicate="intersects"))
+        filtered[category] = [indexed[i][0] for i in hits]
+    return filtered
+
+
+def add_historic_overlay(map_obj, bounds, corners=None):
+    """
+    Add historic and hidden location overlay to the map.
+
+    When the wedge `corners` are given, elements outside the wedge (but inside
+    the query bbox) are dropped before rendering.
+    """
     historic_data = get_historic_and_hidden_areas(bounds)
+    if corners is not None:
+        historic_data = filter_to_wedge(historic_data, corners)
 
     # Color scheme for different types of hiding spots
     category_colors = {
@@ -276,8 +528,7 @@ def add_historic_overlay(map_obj, bounds):
         },
     }
 
-    total_historic = 0
-
+    jobs = []
     for category, items in historic_data.items():
         if not items:
             continue
@@ -291,22 +542,86 @@ def add_historic_overlay(map_obj, bounds):
                 "name": category.title(),
             },
         )
-        feature_group = folium.FeatureGroup(name=f"{colors['name']} ({len(items)})")
+        jobs.append((category, items, colors))
 
-        for item in items:
-            add_historic_item_to_map(feature_group, item, category, colors)
-            total_historic += 1
+    # Category layers are independent, so build them concurrently and attach
+    # them to the map in the original category order
+    with ThreadPoolExecutor() as executor:
+        groups = list(executor.map(lambda job: build_historic_group(*job), jobs))
 
-        if len(items) > 0:
+    total_historic = 0
+    for feature_group, count in groups:
+        if feature_group is not None:
             feature_group.add_to(map_obj)
+            total_historic += count
 
     print(f"🏛️ Added {total_historic} historic and hidden locations")
     return map_obj
 
 
-def add_historic_item_to_map(feature_group, item, category, colors):
-    """Add a historic item to the feature group with detailed information."""
+def build_historic_group(category, items, colors):
+    """
+    Build the feature group holding all items of one category.
+
+    Returns:
+        (feature_group, feature_count); feature_group is None when every item
+        was skipped
+    """
+    import folium
+
+    features = []
+    for item in items:
+        add_historic_item_to_map(features, item, category, colors)
+
+    # Several OSM objects can share one outline (e.g. a cemetery mapped as both
+    # landuse=cemetery and amenity=grave_yard); draw each rounded shape once
+    seen = set()
+    unique = []
+    for feature in features:
+        geometry = feature["geometry"]
+        key = (geometry["type"], repr(geometry["coordinates"]))
+        if key not in seen:
+            seen.add(key)
+            unique.append(feature)
+    features = unique
+
+    if not features:
+        return None, 0
+
+    feature_group = folium.FeatureGroup(name=f"{colors['name']} ({len(features)})")
+
+    # Point features share one icon marker for the whole layer
+    marker = None
+    if any(f["geometry"]["type"] == "Point" for f in features):
+        marker = folium.Marker(
+            icon=folium.Icon(color=colors["color"], icon=colors["icon"], prefix="fa")
+        )
+
+    # One GeoJSON layer per category instead of one Leaflet object per item
+    folium.GeoJson(
+        {"type": "FeatureCollection", "features": features},
+        style_function=lambda feature: feature["properties"]["style"],
+        marker=marker,
+        popup=folium.GeoJsonPopup(fields=["popup"], labels=False),
+        tooltip=folium.GeoJsonTooltip(fields=["name"], labels=False),
+    ).add_to(feature_group)
+
+    return feature_group, len(features)
+
+
+def add_historic_item_to_map(features, item, category, colors):
+    """Append a historic item as a GeoJSON feature with detailed information."""
     tags = item.get("tags", {})
+
+    # Unnamed point markers in these categories are mostly noise (lone
+    # disused poles, private track nodes); skip them to keep the HTML small
+    if (
+        item["type"] == "node"
+        and not tags.get("name")
+        and category in LOW_SIGNAL_UNNAMED
+    ):
+        return
+
     name = tags.get("name", f'Unnamed {category.replace("_", " ")}')
 
     # Create detailed popup for hiding spot analysis
@@ -349,42 +664,55 @@ def add_historic_item_to_map(feature_group, item, category, colors):
     if item["type"] == "node":
         popup_content += f"📍 {item['lat']:.6f}, {item['lon']:.6f}"
 
-        # Add marker for point locations
-        folium.Marker(
-            location=[item["lat"], item["lon"]],
-            popup=popup_content,
-            tooltip=name,
-            icon=folium.Icon(color=colors["color"], icon=colors["icon"], prefix="fa"),
-        ).add_to(feature_group)
+        # Point location, rendered with the layer's marker
+        geometry = {
+            "type": "Point",
+            "coordinates": [
+                round(item["lon"], COORDINATE_DECIMALS),
+                round(item["lat"], COORDINATE_DECIMALS),
+            ],
+        }
+        style = {}
 
     elif item["type"] == "way" and "geometry" in item:
-        coordinates = [[node["lat"], node["lon"]] for node in item["geometry"]]
+        # GeoJSON coordinate order is (lon, lat)
+        coordinates = [[node["lon"], node["lat"]] for node in item["geometry"]]
 
         if len(coordinates) > 2 and coordinates[0] == coordinates[-1]:
             # Area/polygon
-            folium.Polygon(
-                locations=coordinates,
-                popup=popup_content,
-                tooltip=name,
-                color=colors["color"],
-                weight=3,
-                fill=True,
-                fillColor=colors["fillColor"],
-                fillOpacity=0.5,
-            ).add_to(feature_group)
+            coordinates = simplify_coordinates(coordinates, closed=True)
+            geometry = {"type": "Polygon", "coordinates": [coordinates]}
+            style = {
+                "color": colors["color"],
+                "weight": 3,
+                "fill": True,
+                "fillColor": colors["fillColor"],
+                "fillOpacity": 0.5,
+            }
         else:
             # Path/line
-            folium.PolyLine(
-                locations=coordinates,
-                popup=popup_content,
-                tooltip=name,
-                color=colors["color"],
-                weight=4,
-                opacity=0.8,
-            ).add_to(feature_group)
+            if len(coordinates) > 1:
+                coordinates = simplify_coordinates(coordinates, closed=False)
+            geometry = {"type": "LineString", "coordinates": coordinates}
+            style = {"color": colors["color"], "weight": 4, "opacity": 0.8}
+
+    else:
+        return
+
+    features.append(
+        {
+            "type": "Feature",
+            "geometry": geometry,
+            "properties": {"name": name, "popup": popup_content, "style": style},
+        }
+    )
 
 
 def main():
+    import folium
+    import numpy as np
+    from public_areas import PublicAreasOverlay
+
     print("🎯 HISTORIC & HIDDEN LOCATION SEARCH")
     print("🔍 Searching for Sullivan Horse Track and other secluded hiding spots")
     print("=" * 80)
@@ -405,18 +733,17 @@ def main():
     ]
 
     # Calculate center and bounds
-    center_lat = sum(coord[0] for coord in corners) / len(corners)
-    center_lon = sum(coord[1] for coord in corners) / len(corners)
-
-    lats = [corner[0] for corner in corners]
-    lons = [corner[1] for corner in corners]
-
-    south, north = min(lats) - 0.005, max(lats) + 0.005
-    west, east = min(lons) - 0.005, max(lons) + 0.005
+    corners_arr = np.asarray(corners)
+    center_lat, center_lon = corners_arr.mean(axis=0).tolist()
+    south, west = (corners_arr.min(axis=0) - 0.005).tolist()
+    north, east = (corners_arr.max(axis=0) + 0.005).tolist()
     bounds = (south, west, north, east)
 
-    # Create enhanced map
-    search_map = folium.Map(location=[center_lat, center_lon], zoom_start=14)
+    # Create enhanced map; the canvas renderer draws the historic polygons and
+    # lines without one SVG node per shape
+    search_map = folium.Map(
+        location=[center_lat, center_lon], zoom_start=14, prefer_canvas=True
+    )
 
     # Add tile layers
     folium.TileLayer("OpenStreetMap", name="Street View").add_to(search_map)
@@ -436,7 +763,7 @@ def main():
     ).add_to(search_map)
 
     # Add historic and hidden location overlay
-    search_map = add_historic_overlay(search_map, bounds)
+    search_map = add_historic_overlay(search_map, bounds, corners)
 
     # Add regular public areas for context
     try:
@@ -1,63 +1,142 @@
-import folium
+import argparse
+import base64
+import gzip
+import jinja2
+import json
 import math
-from main import create_sector_polygon
+import shutil
+import sys
+from pathlib import Path
 
+import numpy as np
 
-def create_interactive_rotation_map():
+# The controls only rotate in 5° and 15° steps (and reset to 0), so every
+# reachable sector is one of the 360 / ROTATION_STEP_DEGREES rotations in
+# [0, 360); rotations 360° apart draw the same sector
+ROTATION_STEP_DEGREES = 5
+NUM_ARC_POINTS = 20
+# Precision of the embedded coordinates (1e-6° is about 0.1 m)
+TABLE_DECIMALS = 6
+
+# Leaflet is loaded from the CDN unless the page is bundled, in which case a
+# local copy of Leaflet's dist/ folder (leaflet.js, leaflet.css, images/) is
+# copied next to the page and loaded from disk
+LEAFLET_CDN_URL = "https://unpkg.com/leaflet@1.9.4/dist/"
+LEAFLET_ASSETS_DIR = Path(__file__).resolve().parent / "assets" / "leaflet"
+
+
+def build_rotation_tables(
+    center_lat,
+    center_lon,
+    bearing_lat,
+    bearing_lon,
+    width_degrees,
+    min_radius_miles,
+    max_radius_miles,
+):
     """
-    Creates an interactive map with browser-based rotation controls for the sector polygon.
+    Precompute the sector polygon and reference lines for every reachable rotation.
+
+    Returns:
+        (sector_table, lines_table): nested lists indexed by rotation / step;
+        sector_table[k] is the closed ring of [lat, lon] points and lines_table[k]
+        holds the center, left and right reference lines as [start, end] pairs
     """
-    # Day 15 coordinates
-    start_lat, start_lon = 40.364551, -74.950404
-    direction_lat, direction_lon = 40.365207, -74.947155
+    # Base bearing from center to bearing point
+    lat1, lon1 = math.radians(center_lat), math.radians(center_lon)
+    lat2, lon2 = math.radians(bearing_lat), math.radians(bearing_lon)
+    dlon = lon2 - lon1
+    base_bearing = math.atan2(
+        math.sin(dlon) * math.cos(lat2),
+        math.cos(lat1) * math.sin(lat2)
+        - math.sin(lat1) * math.cos(lat2) * math.cos(dlon),
+    )
+
+    rotations = np.arange(0, 360, ROTATION_STEP_DEGREES)
+    bearings_center = base_bearing + np.deg2rad(rotations)
+    half_width = math.radians(width_degrees / 2)
+
+    min_radius_deg = min_radius_miles / 69.0
+    max_radius_deg = max_radius_miles / 69.0
+    lon_scale = 1 / math.cos(math.radians(center_lat))
+
+    # (rotations, arc points) bearings from left to right boundary; the inner
+    # and outer arcs share them, so cos/sin are evaluated once for both
+    arc = bearings_center[:, None] + np.linspace(
+        -half_width, half_width, NUM_ARC_POINTS + 1
+    )
+    arc_lat, arc_lon = np.cos(arc), np.sin(arc) * lon_scale
+
+    def arc_points(radius_deg):
+        """(rotations, arc points, 2) [lat, lon] points at the given radius."""
+        return np.stack(
+            [center_lat + radius_deg * arc_lat, center_lon + radius_deg * arc_lon],
+            axis=-1,
+        )
+
+    inner = arc_points(min_radius_deg)
+    outer = arc_points(max_radius_deg)[:, ::-1]
+    # Inner arc left to right, outer arc right to left, closed at the inner start
+    sectors = np.concatenate([inner, outer, inner[:, :1]], axis=1)
+
+    center = np.broadcast_to([center_lat, center_lon], (len(rotations), 2))
+    center_end = np.stack(
+        [
+            center_lat + max_radius_deg * np.cos(bearings_center),
+            center_lon + max_radius_deg * np.sin(bearings_center) * lon_scale,
+        ],
+        axis=-1,
+    )
+    # Boundary lines end where the inner arc starts (left) and ends (right)
+    lines = np.stack(
+        [
+            np.stack([center, center_end], axis=1),
+            np.stack([center, inner[:, 0]], axis=1),
+            np.stack([center, inner[:, -1]], axis=1),
+        ],
+        axis=1,
+    )
+
+    return (
+        np.round(sectors, TABLE_DECIMALS).tolist(),
+        np.round(lines, TABLE_DECIMALS).tolist(),
+    )
+
+
+def encode_rotation_tables(sector_table, lines_table):
+    """
+    Base64 of the gzipped compact JSON [sector_table, lines_table], decoded by
+    the page with DecompressionStream (about a quarter of the plain JSON size).
+    """
+    data = json.dumps([sector_table, lines_table], separators=(",", ":"))
+    # mtime=0 keeps the output byte-identical between runs
+    return base64.b64encode(gzip.compress(data.encode("ascii"), mtime=0)).decode(
+        "ascii"
+    )
+
 
-    # Create base map
-    m = folium.Map(location=[start_lat, start_lon], zoom_start=11)
-
-    # Add satellite view
-    folium.TileLayer(
-        tiles="https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
-        attr="Esri",
-        name="Satellite View",
-        overlay=False,
-        control=True,
-    ).add_to(m)
-
-    # Add center marker
-    folium.Marker(
-        location=[start_lat, start_lon],
-        popup="Day 15 - New Hope Bridge (Interactive Rotation Center)",
-        tooltip="Rotation Center - Use controls to rotate sector",
-        icon=folium.Icon(color="red", icon="star"),
-    ).add_to(m)
-
-    # Add layer control
-    folium.LayerControl().add_to(m)
-
-    # Get the HTML representation
-    map_html = m._repr_html_()
-
-    # Create custom HTML with JavaScript controls
-    interactive_html = f"""
+# Page with the Leaflet map and rotation controls, compiled once at import
+INTERACTIVE_PAGE_TEMPLATE = jinja2.Template(
+    """
 <!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
     <meta name="viewport" content="width=device-width, initial-scale=1">
     <title>Interactive Sector Rotation - Day 15</title>
-    <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css"/>
-    <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
+    <link rel="stylesheet" href="{{ leaflet_url }}leaflet.css"/>
+    <script src="{{ leaflet_url }}leaflet.js"></script>
     <style>
-        body {{
+        body {
             margin: 0;
             padding: 0;
             font-family: Arial, sans-serif;
-        }}
-        #map {{
+        }
+        #map {
             height: 85vh;
             width: 100%;
-        }}
-        .controls {{
+        }
+        .controls {
             background: white;
             padding: 15px;
             border-radius: 8px;
@@ -67,22 +146,22 @@ def create_interactive_rotation_map():
             right: 10px;
             z-index: 1000;
             min-width: 250px;
-        }}
-        .control-group {{
+        }
+        .control-group {
             margin-bottom: 12px;
-        }}
-        .control-group label {{
+        }
+        .control-group label {
             display: block;
             font-weight: bold;
             margin-bottom: 5px;
             color: #333;
-        }}
-        .button-group {{
+        }
+        .button-group {
             display: flex;
             gap: 8px;
             margin-bottom: 8px;
-        }}
-        button {{
+        }
+        button {
             padding: 8px 12px;
             border: none;
             border-radius: 4px;
@@ -90,32 +169,32 @@ def create_interactive_rotation_map():
             font-size: 14px;
             font-weight: bold;
             transition: background-color 0.2s;
-        }}
-        .rotate-btn {{
+        }
+        .rotate-btn {
             background: #4CAF50;
             color: white;
             flex: 1;
-        }}
-        .rotate-btn:hover {{
+        }
+        .rotate-btn:hover {
             background: #45a049;
-        }}
-        .reset-btn {{
+        }
+        .reset-btn {
             background: #f44336;
             color: white;
             width: 100%;
-        }}
-        .reset-btn:hover {{
+        }
+        .reset-btn:hover {
             background: #da190b;
-        }}
-        .fine-btn {{
+        }
+        .fine-btn {
             background: #2196F3;
             color: white;
             flex: 1;
-        }}
-        .fine-btn:hover {{
+        }
+        .fine-btn:hover {
             background: #1976D2;
-        }}
-        .angle-display {{
+        }
+        .angle-display {
             background: #f5f5f5;
             padding: 8px;
             border-radius: 4px;
@@ -124,13 +203,13 @@ def create_interactive_rotation_map():
             font-size: 16px;
             font-weight: bold;
             border: 2px solid #ddd;
-        }}
-        .instructions {{
+        }
+        .instructions {
             font-size: 12px;
             color: #666;
             margin-top: 10px;
             line-height: 1.4;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -162,224 +241,153 @@ def create_interactive_rotation_map():
     </div>
 
     <script>
-        // Initialize map
-        var map = L.map('map').setView([{start_lat}, {start_lon}], 11);
+        // Initialize map; vector layers draw on one shared canvas instead of
+        // an SVG path per layer
+        var map = L.map('map', { preferCanvas: true }).setView([{{ start_lat }}, {{ start_lon }}], 11);
         
         // Add tile layers
-        var streetLayer = L.tileLayer('https://{{s}}.tile.openstreetmap.org/{{z}}/{{x}}/{{y}}.png', {{
+        var streetLayer = L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', {
             attribution: '© OpenStreetMap contributors'
-        }});
+        });
         
-        var satelliteLayer = L.tileLayer('https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{{z}}/{{y}}/{{x}}', {{
+        var satelliteLayer = L.tileLayer('https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}', {
             attribution: 'Esri'
-        }});
+        });
         
         // Add default layer
         satelliteLayer.addTo(map);
         
         // Layer control
-        var baseMaps = {{
+        var baseMaps = {
             "Street View": streetLayer,
             "Satellite View": satelliteLayer
-        }};
+        };
         L.control.layers(baseMaps).addTo(map);
         
         // Add center marker
-        var centerMarker = L.marker([{start_lat}, {start_lon}])
+        var centerMarker = L.marker([{{ start_lat }}, {{ start_lon }}])
             .addTo(map)
             .bindPopup("Day 15 - New Hope Bridge<br>Interactive Rotation Center")
             .bindTooltip("Rotation Center - Use controls to rotate sector");
         
         // Sector parameters
-        var centerLat = {start_lat};
-        var centerLon = {start_lon};
-        var bearingLat = {direction_lat};
-        var bearingLon = {direction_lon};
-        var widthDegrees = 30;
-        var minRadiusMiles = 10;
-        var maxRadiusMiles = 25;
+        var widthDegrees = {{ width_degrees }};
+        var minRadiusMiles = {{ min_radius_miles }};
+        var maxRadiusMiles = {{ max_radius_miles }};
         var currentRotation = 0;
         
-        // Current sector polygon and reference lines
-        var sectorPolygon = null;
-        var centerLine = null;
-        var leftBoundaryLine = null;
-        var rightBoundaryLine = null;
+        // Sector ring and [center, left, right] reference lines for every
+        // rotation step in [0, 360), precomputed in Python and embedded as
+        // base64 gzip JSON ([sectors, lines]); decoded once at load
+        var ROTATION_STEP = {{ rotation_step }};
+        var ROTATION_TABLES_GZ = "{{ rotation_tables_gz }}";
+        var SECTOR_TABLE = null;
+        var LINES_TABLE = null;
         
-        // Calculate bearing between two points
-        function calculateBearing(lat1, lon1, lat2, lon2) {{
-            var dLon = (lon2 - lon1) * Math.PI / 180;
-            var lat1Rad = lat1 * Math.PI / 180;
-            var lat2Rad = lat2 * Math.PI / 180;
-            
-            var y = Math.sin(dLon) * Math.cos(lat2Rad);
-            var x = Math.cos(lat1Rad) * Math.sin(lat2Rad) - Math.sin(lat1Rad) * Math.cos(lat2Rad) * Math.cos(dLon);
-            
-            return Math.atan2(y, x);
-        }}
+        function loadRotationTables() {
+            var bytes = Uint8Array.from(atob(ROTATION_TABLES_GZ), function(c) {
+                return c.charCodeAt(0);
+            });
+            var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+            return new Response(stream).json();
+        }
         
-        // Create reference line coordinates
-        function createReferenceLines(rotationDegrees) {{
-            var bearingCenter = calculateBearing(centerLat, centerLon, bearingLat, bearingLon);
-            bearingCenter += rotationDegrees * Math.PI / 180; // Apply rotation
-            
-            var halfWidth = widthDegrees * Math.PI / 360; // Convert to radians and halve
-            var bearingLeft = bearingCenter - halfWidth;
-            var bearingRight = bearingCenter + halfWidth;
-            
-            var minRadiusDeg = minRadiusMiles / 69.0;
-            var maxRadiusDeg = maxRadiusMiles / 69.0;
-            
-            // Center line (extends through entire sector)
-            var centerLineStart = [
-                centerLat + maxRadiusDeg * Math.cos(bearingCenter),
-                centerLon + maxRadiusDeg * Math.sin(bearingCenter) / Math.cos(centerLat * Math.PI / 180)
-            ];
-            var centerLineEnd = [centerLat, centerLon];
-            
-            // Left boundary line (from center to min radius)
-            var leftLineStart = [centerLat, centerLon];
-            var leftLineEnd = [
-                centerLat + minRadiusDeg * Math.cos(bearingLeft),
-                centerLon + minRadiusDeg * Math.sin(bearingLeft) / Math.cos(centerLat * Math.PI / 180)
-            ];
-            
-            // Right boundary line (from center to min radius)
-            var rightLineStart = [centerLat, centerLon];
-            var rightLineEnd = [
-                centerLat + minRadiusDeg * Math.cos(bearingRight),
-                centerLon + minRadiusDeg * Math.sin(bearingRight) / Math.cos(centerLat * Math.PI / 180)
-            ];
-            
-            return {{
-                center: [centerLineEnd, centerLineStart],
-                left: [leftLineStart, leftLineEnd],
-                right: [rightLineStart, rightLineEnd]
-            }};
-        }}
+        // Table row for a rotation (rotations 360° apart are the same sector)
+        function rotationIndex(rotationDegrees) {
+            return (((rotationDegrees % 360) + 360) % 360) / ROTATION_STEP;
+        }
         
-        // Create sector polygon coordinates
-        function createSectorCoordinates(rotationDegrees) {{
-            var bearingCenter = calculateBearing(centerLat, centerLon, bearingLat, bearingLon);
-            bearingCenter += rotationDegrees * Math.PI / 180; // Apply rotation
-            
-            var halfWidth = widthDegrees * Math.PI / 360; // Convert to radians and halve
-            var bearingLeft = bearingCenter - halfWidth;
-            var bearingRight = bearingCenter + halfWidth;
-            
-            var minRadiusDeg = minRadiusMiles / 69.0;
-            var maxRadiusDeg = maxRadiusMiles / 69.0;
-            
-            var coords = [];
-            
-            // Arc along minimum radius from left to right
-            var numArcPoints = 20;
-            for (var i = 0; i <= numArcPoints; i++) {{
-                var bearing = bearingLeft + (bearingRight - bearingLeft) * i / numArcPoints;
-                var lat = centerLat + minRadiusDeg * Math.cos(bearing);
-                var lon = centerLon + minRadiusDeg * Math.sin(bearing) / Math.cos(centerLat * Math.PI / 180);
-                coords.push([lat, lon]);
-            }}
-            
-            // Arc along maximum radius from right to left
-            for (var i = 0; i <= numArcPoints; i++) {{
-                var bearing = bearingRight - (bearingRight - bearingLeft) * i / numArcPoints;
-                var lat = centerLat + maxRadiusDeg * Math.cos(bearing);
-                var lon = centerLon + maxRadiusDeg * Math.sin(bearing) / Math.cos(centerLat * Math.PI / 180);
-                coords.push([lat, lon]);
-            }}
-            
-            // Close polygon back to start of min radius arc (no center point)
-            var bearing = bearingLeft;
-            var lat = centerLat + minRadiusDeg * Math.cos(bearing);
-            var lon = centerLon + minRadiusDeg * Math.sin(bearing) / Math.cos(centerLat * Math.PI / 180);
-            coords.push([lat, lon]);
-            
-            return coords;
-        }}
+        // Sector polygon and reference lines, created once (empty until the
+        // tables are decoded); rotating only replaces their coordinates so
+        // Leaflet reuses the drawn paths
+        var sectorPolygon = L.polygon([], {
+            color: 'blue',
+            weight: 2,
+            fillColor: 'lightblue',
+            fillOpacity: 0.4
+        }).addTo(map);
+        sectorPolygon.bindPopup("");
+        
+        // Center bearing line (dashed, extends through center)
+        var centerLine = L.polyline([], {
+            color: 'red',
+            weight: 2,
+            dashArray: '8, 8',
+            opacity: 0.8
+        }).addTo(map);
+        centerLine.bindTooltip("Center Bearing Line");
+        
+        // Left boundary line (dashed, center to min radius)
+        var leftBoundaryLine = L.polyline([], {
+            color: 'purple',
+            weight: 2,
+            dashArray: '6, 6',
+            opacity: 0.8
+        }).addTo(map);
+        leftBoundaryLine.bindTooltip("Left Boundary (-15°) - Center to Min Radius");
+        
+        // Right boundary line (dashed, center to min radius)
+        var rightBoundaryLine = L.polyline([], {
+            color: 'purple',
+            weight: 2,
+            dashArray: '6, 6',
+            opacity: 0.8
+        }).addTo(map);
+        rightBoundaryLine.bindTooltip("Right Boundary (+15°) - Center to Min Radius");
         
         // Update sector display
-        function updateSector() {{
-            // Remove existing sector and lines
-            if (sectorPolygon) {{
-                map.removeLayer(sectorPolygon);
-            }}
-            if (centerLine) {{
-                map.removeLayer(centerLine);
-            }}
-            if (leftBoundaryLine) {{
-                map.removeLayer(leftBoundaryLine);
-            }}
-            if (rightBoundaryLine) {{
-                map.removeLayer(rightBoundaryLine);
-            }}
-            
-            // Create new sector
-            var coords = createSectorCoordinates(currentRotation);
-            sectorPolygon = L.polygon(coords, {{
-                color: 'blue',
-                weight: 2,
-                fillColor: 'lightblue',
-                fillOpacity: 0.4
-            }}).addTo(map);
-            
-            sectorPolygon.bindPopup(`Day 15 Search Sector<br>Rotation: ${{currentRotation}}°<br>Range: ${{minRadiusMiles}}-${{maxRadiusMiles}} miles`);
-            
-            // Create reference lines
-            var refLines = createReferenceLines(currentRotation);
-            
-            // Center bearing line (dashed, extends through center)
-            centerLine = L.polyline(refLines.center, {{
-                color: 'red',
-                weight: 2,
-                dashArray: '8, 8',
-                opacity: 0.8
-            }}).addTo(map);
-            centerLine.bindTooltip("Center Bearing Line");
-            
-            // Left boundary line (dashed, center to min radius)
-            leftBoundaryLine = L.polyline(refLines.left, {{
-                color: 'purple',
-                weight: 2,
-                dashArray: '6, 6',
-                opacity: 0.8
-            }}).addTo(map);
-            leftBoundaryLine.bindTooltip("Left Boundary (-15°) - Center to Min Radius");
-            
-            // Right boundary line (dashed, center to min radius)
-            rightBoundaryLine = L.polyline(refLines.right, {{
-                color: 'purple',
-                weight: 2,
-                dashArray: '6, 6',
-                opacity: 0.8
-            }}).addTo(map);
-            rightBoundaryLine.bindTooltip("Right Boundary (+15°) - Center to Min Radius");
-            
+        function updateSector() {
             // Update angle display
             document.getElementById('angle-display').textContent = currentRotation + '°';
-        }}
+            if (SECTOR_TABLE === null) return;  // drawn once the tables load
+            
+            var index = rotationIndex(currentRotation);
+            var refLines = LINES_TABLE[index];
+            
+            sectorPolygon.setLatLngs(SECTOR_TABLE[index]);
+            sectorPolygon.setPopupContent(`Day 15 Search Sector<br>Rotation: ${currentRotation}°<br>Range: ${minRadiusMiles}-${maxRadiusMiles} miles`);
+            centerLine.setLatLngs(refLines[0]);
+            leftBoundaryLine.setLatLngs(refLines[1]);
+            rightBoundaryLine.setLatLngs(refLines[2]);
+        }
+        
+        // Redraw on the next animation frame; rotations requested before it
+        // (key autorepeat, fast clicks) share a single redraw
+        var pendingFrame = null;
+        function scheduleUpdate() {
+            if (pendingFrame !== null) return;
+            pendingFrame = requestAnimationFrame(function() {
+                pendingFrame = null;
+                updateSector();
+            });
+        }
         
         // Rotate sector
-        function rotateSector(degrees) {{
+        function rotateSector(degrees) {
             currentRotation += degrees;
             // Keep rotation between -360 and 360
             if (currentRotation > 360) currentRotation -= 360;
             if (currentRotation < -360) currentRotation += 360;
-            updateSector();
-        }}
+            scheduleUpdate();
+        }
         
         // Reset rotation
-        function resetRotation() {{
+        function resetRotation() {
             currentRotation = 0;
-            updateSector();
-        }}
+            scheduleUpdate();
+        }
         
-        // Initialize with original sector
+        // Initialize with original sector (or the rotation chosen meanwhile)
         updateSector();
+        loadRotationTables().then(function(tables) {
+            SECTOR_TABLE = tables[0];
+            LINES_TABLE = tables[1];
+            updateSector();
+        });
         
         // Add keyboard controls
-        document.addEventListener('keydown', function(event) {{
-            switch(event.key) {{
+        document.addEventListener('keydown', function(event) {
+            switch(event.key) {
                 case 'ArrowLeft':
                     rotateSector(-5);
                     event.preventDefault();
@@ -393,20 +401,82 @@ def create_interactive_rotation_map():
                     resetRotation();
                     event.preventDefault();
                     break;
-            }}
-        }});
+            }
+        });
         
         console.log("Interactive rotation controls loaded!");
         console.log("Use arrow keys for 5° rotation, or R to reset");
     </script>
 </body>
 </html>
-"""
+""",
+    keep_trailing_newline=True,
+)
+
+
+def bundle_leaflet_assets(output_dir, assets_dir=LEAFLET_ASSETS_DIR):
+    """
+    Copy the local Leaflet dist/ files into output_dir/leaflet.
+
+    Returns:
+        Base URL of the copied files, relative to pages in output_dir
+    """
+    assets_dir = Path(assets_dir)
+    required = ("leaflet.js", "leaflet.css")
+    missing = [name for name in required if not (assets_dir / name).is_file()]
+    if missing:
+        raise FileNotFoundError(
+            f"Leaflet assets missing from {assets_dir}: {', '.join(missing)} "
+            f"(copy the dist/ folder of Leaflet 1.9.4 there)"
+        )
+
+    shutil.copytree(assets_dir, Path(output_dir) / "leaflet", dirs_exist_ok=True)
+    return "leaflet/"
+
+
+def create_interactive_rotation_map(bundle=False):
+    """
+    Creates an interactive map with browser-based rotation controls for the sector polygon.
+
+    Args:
+        bundle: Load Leaflet from a copy next to the page instead of the CDN
+    """
+    # Day 15 coordinates
+    start_lat, start_lon = 40.364551, -74.950404
+    direction_lat, direction_lon = 40.365207, -74.947155
+    width_degrees, min_radius_miles, max_radius_miles = 30, 10, 25
+
+    sector_table, lines_table = build_rotation_tables(
+        start_lat,
+        start_lon,
+        direction_lat,
+        direction_lon,
+        width_degrees,
+        min_radius_miles,
+        max_radius_miles,
+    )
 
     # Save the interactive map
     filename = "interactive_sector_rotation.html"
-    with open(filename, "w") as f:
-        f.write(interactive_html)
+    leaflet_url = LEAFLET_CDN_URL
+    if bundle:
+        leaflet_url = bundle_leaflet_assets(Path(filename).parent)
+
+    interactive_html = INTERACTIVE_PAGE_TEMPLATE.render(
+        leaflet_url=leaflet_url,
+        start_lat=start_lat,
+        start_lon=start_lon,
+        width_degrees=width_degrees,
+        min_radius_miles=min_radius_miles,
+        max_radius_miles=max_radius_miles,
+        rotation_step=ROTATION_STEP_DEGREES,
+        rotation_tables_gz=encode_rotation_tables(sector_table, lines_table),
+    )
+
+    # Encoded once and written as bytes: the page declares UTF-8 (and contains
+    # emoji and degree signs) whatever the platform's default encoding
+    with open(filename, "wb") as f:
+        f.write(interactive_html.encode("utf-8"))
 
     print(f"Interactive rotation map created: {filename}")
     print("🎯 Controls available:")
@@ -414,9 +484,26 @@ def create_interactive_rotation_map():
     print("  • Reset button to return to original bearing")
     print("  • Keyboard: Arrow keys (5°), R key (reset)")
     print("  • Real-time angle display")
+    if bundle:
+        print(f"  • Leaflet loaded from local copy: {leaflet_url}")
 
     return filename
 
 
 if __name__ == "__main__":
-    create_interactive_rotation_map()
+    parser = argparse.ArgumentParser(
+        description="Create the interactive sector rotation map"
+    )
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help=f"Load Leaflet from a copy of {LEAFLET_ASSETS_DIR} next to the page "
+        "instead of the unpkg CDN (works offline)",
+    )
+    args = parser.parse_args()
+
+    try:
+        create_interactive_rotation_map(bundle=args.bundle)
+    except FileNotFoundError as e:
+        # Leaflet is not shipped with the repo; --bundle needs a local copy
+        sys.exit(f"❌ Cannot bundle Leaflet: {e}")
@@ -5,98 +5,122 @@ Identify substantial public spaces like entire parks, forests, preserves,
 and other large areas open to the public for exploration and hiding spots.
 """
 
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import folium
+import numpy as np
 import requests
-import json
 
+from public_areas_utils import iter_overpass_elements, stream_overpass_response
+
+OVERPASS_URL = "https://overpass-api.de/api/interpreter"
+
+# Overpass responses are cached on disk, keyed by a hash of the (bbox-specific)
+# query text, so repeated runs over the same wedge skip the network round-trip
+CACHE_DIR = Path.home() / ".cache" / "py_test" / "overpass"
+CACHE_MAX_AGE = 86400  # seconds
+
+# overpass-api.de allows two concurrent requests per client IP; callers that
+# fetch several bboxes from worker threads queue on this
+OVERPASS_SLOTS = threading.BoundedSemaphore(2)
 
-def get_large_public_areas(bounds):
+
+def fetch_overpass_elements(query, max_age_seconds=CACHE_MAX_AGE):
+    """
+    Run an Overpass query, serving it from the disk cache when a response
+    younger than max_age_seconds is already stored.
+
+    The response is parsed incrementally, so elements are yielded while the
+    body is still being received (or read back from the cache) and the full
+    document is never held in memory.
+    """
+    cache_file = CACHE_DIR / f"{hashlib.sha256(query.encode()).hexdigest()}.json"
+    try:
+        is_fresh = time.time() - cache_file.stat().st_mtime < max_age_seconds
+    except OSError:
+        is_fresh = False  # no cache entry yet
+    if is_fresh:
+        with open(cache_file, "rb") as f:
+            yield from iter_overpass_elements(f)
+        return
+
+    # This request's Overpass slot stays held until its body has been fully
+    # received
+    with OVERPASS_SLOTS:
+        response = requests.post(OVERPASS_URL, data=query, timeout=60, stream=True)
+        response.raise_for_status()
+        yield from stream_overpass_response(response, cache_file)
+
+
+def get_large_public_areas(bounds, max_age_seconds=CACHE_MAX_AGE):
     """
     Get large public areas like parks, forests, preserves, recreation areas.
 
     Args:
         bounds: Tuple of (south, west, north, east) coordinates
+        max_age_seconds: Maximum age of a cached Overpass response to reuse
 
     Returns:
         Dictionary with categorized large public areas
     """
-    south, west, north, east = bounds
+    # Rounded (~0.1 m) so float noise in the bounds doesn't change the cache key
+    south, west, north, east = (round(c, 6) for c in bounds)
 
     # Query for substantial public areas
     query = f"""
     [out:json][timeout:60];
     (
-      // Large parks and recreation areas
-      way["leisure"="park"]["area"!="no"]({south},{west},{north},{east});
-      relation["leisure"="park"]({south},{west},{north},{east});
-      way["leisure"="recreation_ground"]({south},{west},{north},{east});
-      
-      // Nature preserves and protected areas
-      way["leisure"="nature_reserve"]({south},{west},{north},{east});
-      relation["leisure"="nature_reserve"]({south},{west},{north},{east});
+      // Parks, preserves, recreation grounds and other leisure areas; parks
+      // and dog parks skip ways explicitly tagged as not being areas
+      way["leisure"~"^(park|dog_park)$"]["area"!="no"]({south},{west},{north},{east});
+      way["leisure"~"^(recreation_ground|nature_reserve|sports_complex|golf_course|swimming_area|common)$"]({south},{west},{north},{east});
+      relation["leisure"~"^(park|nature_reserve)$"]({south},{west},{north},{east});
+
+      // Protected areas and wildlife management areas
       way["boundary"="protected_area"]({south},{west},{north},{east});
       relation["boundary"="protected_area"]({south},{west},{north},{east});
-      
-      // Forests and wooded areas
-      way["landuse"="forest"]({south},{west},{north},{east});
+      way["protect_class"]({south},{west},{north},{east});
+      relation["protect_class"]({south},{west},{north},{east});
+
+      // Forests, wooded areas and public open space
+      way["landuse"~"^(forest|recreation_ground)$"]({south},{west},{north},{east});
       relation["landuse"="forest"]({south},{west},{north},{east});
       way["natural"="wood"]({south},{west},{north},{east});
       relation["natural"="wood"]({south},{west},{north},{east});
-      
-      // State and county parks
-      way["leisure"="park"]["operator"~"[Ss]tate|[Cc]ounty|[Gg]overnment"]({south},{west},{north},{east});
-      relation["leisure"="park"]["operator"~"[Ss]tate|[Cc]ounty|[Gg]overnment"]({south},{west},{north},{east});
-      
-      // Wildlife management areas
-      way["protect_class"]({south},{west},{north},{east});
-      relation["protect_class"]({south},{west},{north},{east});
-      
-      // Large recreational complexes
-      way["leisure"="sports_complex"]({south},{west},{north},{east});
-      way["leisure"="golf_course"]({south},{west},{north},{east});
-      
+
       // Greenways and trail systems
       way["highway"="path"]["name"]({south},{west},{north},{east});
       way["route"="hiking"]({south},{west},{north},{east});
       relation["route"="hiking"]({south},{west},{north},{east});
-      
+
       // Water recreation areas
-      way["leisure"="swimming_area"]({south},{west},{north},{east});
       way["natural"="water"]["leisure"]({south},{west},{north},{east});
-      
-      // Public open space
-      way["landuse"="recreation_ground"]({south},{west},{north},{east});
-      way["leisure"="common"]({south},{west},{north},{east});
-      
-      // Specific large park types
-      way["leisure"="dog_park"]["area"!="no"]({south},{west},{north},{east});
+
       way["amenity"="public_bookcase"]({south},{west},{north},{east}); // Often in parks
     );
     out geom;
     """
 
+    # Categorize the findings
+    categories = {
+        "major_parks": [],
+        "forests_woods": [],
+        "nature_preserves": [],
+        "state_county_parks": [],
+        "recreation_areas": [],
+        "golf_courses": [],
+        "trail_systems": [],
+        "water_recreation": [],
+        "open_spaces": [],
+    }
+
     try:
         print("🌳 Searching for large public areas...")
-        response = requests.post(
-            "https://overpass-api.de/api/interpreter", data=query, timeout=60
-        )
-        response.raise_for_status()
-        data = response.json()
-
-        # Categorize the findings
-        categories = {
-            "major_parks": [],
-            "forests_woods": [],
-            "nature_preserves": [],
-            "state_county_parks": [],
-            "recreation_areas": [],
-            "golf_courses": [],
-            "trail_systems": [],
-            "water_recreation": [],
-            "open_spaces": [],
-        }
-
-        for element in data.get("elements", []):
+        for element in fetch_overpass_elements(query, max_age_seconds):
             category = classify_public_area(element)
             if category in categories:
                 categories[category].append(element)
@@ -105,7 +129,44 @@ def get_large_public_areas(bounds):
 
     except Exception as e:
         print(f"⚠️ Error fetching public area data: {e}")
-        return {k: [] for k in categories.keys()}
+        return {k: [] for k in categories}
+
+
+# Categories in the precedence order classify_public_area applies them; the
+# rule tables below map to indexes into this tuple, lowest index wins
+PUBLIC_AREA_CATEGORIES = (
+    "state_county_parks",
+    "nature_preserves",
+    "forests_woods",
+    "golf_courses",
+    "trail_systems",
+    "water_recreation",
+    "recreation_areas",
+    "open_spaces",
+    "major_parks",  # default for parks
+)
+_RANK = {category: rank for rank, category in enumerate(PUBLIC_AREA_CATEGORIES)}
+DEFAULT_RANK = _RANK["major_parks"]
+
+# Exact (key, value) tag matches
+TAG_CATEGORY_RANKS = {
+    ("leisure", "nature_reserve"): _RANK["nature_preserves"],
+    ("boundary", "protected_area"): _RANK["nature_preserves"],
+    ("landuse", "forest"): _RANK["forests_woods"],
+    ("natural", "wood"): _RANK["forests_woods"],
+    ("leisure", "golf_course"): _RANK["golf_courses"],
+    ("route", "hiking"): _RANK["trail_systems"],
+    ("leisure", "swimming_area"): _RANK["water_recreation"],
+    ("leisure", "recreation_ground"): _RANK["recreation_areas"],
+    ("leisure", "sports_complex"): _RANK["recreation_areas"],
+    ("landuse", "recreation_ground"): _RANK["recreation_areas"],
+    ("leisure", "common"): _RANK["open_spaces"],
+}
+
+_PRESERVE_RANK = _RANK["nature_preserves"]
+_TRAIL_RANK = _RANK["trail_systems"]
+_WATER_RANK = _RANK["water_recreation"]
+_OPEN_SPACE_RANK = _RANK["open_spaces"]
 
 
 def classify_public_area(element):
@@ -113,86 +174,121 @@ def classify_public_area(element):
     tags = element.get("tags", {})
     name = tags.get("name", "").lower()
 
-    # State/County parks
+    # State/County parks outrank everything else
     if (
-        tags.get("operator", "").lower() in ["state", "county"]
+        tags.get("operator", "").lower() in ("state", "county")
         or "state" in name
         or "county" in name
     ):
         return "state_county_parks"
 
-    # Nature preserves and protected areas
-    elif (
-        tags.get("leisure") == "nature_reserve"
-        or tags.get("boundary") == "protected_area"
-        or "preserve" in name
-        or "wildlife" in name
-    ):
-        return "nature_preserves"
-
-    # Forests and woods
-    elif tags.get("landuse") == "forest" or tags.get("natural") == "wood":
-        return "forests_woods"
-
-    # Golf courses
-    elif tags.get("leisure") == "golf_course":
-        return "golf_courses"
-
-    # Trail systems and greenways
-    elif (
-        tags.get("route") == "hiking"
-        or (tags.get("highway") == "path" and tags.get("name"))
-        or "trail" in name
-        or "greenway" in name
-    ):
-        return "trail_systems"
+    # Best exact tag match, as an index into PUBLIC_AREA_CATEGORIES
+    rank = DEFAULT_RANK
+    for tag in tags.items():
+        tag_rank = TAG_CATEGORY_RANKS.get(tag)
+        if tag_rank is not None and tag_rank < rank:
+            rank = tag_rank
+
+    # Rules that need a second tag
+    if rank > _TRAIL_RANK:
+        if tags.get("highway") == "path" and tags.get("name"):
+            rank = _TRAIL_RANK
+        elif rank > _WATER_RANK and tags.get("natural") == "water":
+            if tags.get("leisure"):
+                rank = _WATER_RANK
+
+    # Name substrings only matter for categories that outrank the tag match
+    if name:
+        if rank > _PRESERVE_RANK and ("preserve" in name or "wildlife" in name):
+            return "nature_preserves"
+        if rank > _TRAIL_RANK and ("trail" in name or "greenway" in name):
+            return "trail_systems"
+        if rank > _OPEN_SPACE_RANK and ("common" in name or "green" in name):
+            return "open_spaces"
+
+    return PUBLIC_AREA_CATEGORIES[rank]
+
+
+def convert_way_coordinates(ways):
+    """
+    Convert the geometry dicts of many ways in one pass.
 
-    # Water recreation
-    elif tags.get("leisure") == "swimming_area" or (
-        tags.get("natural") == "water" and tags.get("leisure")
-    ):
-        return "water_recreation"
+    Each way gets an (N, 2) float64 array of (lat, lon) under "_coords", a view
+    into one array shared by the batch, so sizing and rendering reuse a single
+    conversion of the per-node dicts.
+    """
+    if not ways:
+        return
+    geometries = [way["geometry"] for way in ways]
+    lengths = np.fromiter(map(len, geometries), dtype=np.intp, count=len(ways))
+    coords = np.fromiter(
+        (v for geom in geometries for node in geom for v in (node["lat"], node["lon"])),
+        dtype=np.float64,
+        count=2 * int(lengths.sum()),
+    ).reshape(-1, 2)
+    for way, way_coords in zip(ways, np.split(coords, np.cumsum(lengths[:-1]))):
+        way["_coords"] = way_coords
+
+
+def way_coordinates(element):
+    """Return a way's nodes as an (N, 2) float64 array of (lat, lon)."""
+    if "_coords" not in element:
+        convert_way_coordinates([element])
+    return element["_coords"]
 
-    # Recreation areas and complexes
-    elif (
-        tags.get("leisure") in ["recreation_ground", "sports_complex"]
-        or tags.get("landuse") == "recreation_ground"
-    ):
-        return "recreation_areas"
 
-    # General open spaces
-    elif tags.get("leisure") == "common" or "common" in name or "green" in name:
-        return "open_spaces"
+def calculate_area_size(element):
+    """Estimate the size category of an area."""
+    return calculate_area_sizes([element])[0]
 
-    # Major parks (default for parks)
-    else:
-        return "major_parks"
 
+def calculate_area_sizes(elements):
+    """
+    Estimate the size category of each area in one vectorized pass.
 
-def calculate_area_size(element):
-    """Estimate the size category of an area."""
-    if element["type"] == "way" and "geometry" in element:
-        # Simple estimation based on bounding box
-        coords = element["geometry"]
-        if len(coords) > 3:
-            lats = [c["lat"] for c in coords]
-            lons = [c["lon"] for c in coords]
-            lat_span = max(lats) - min(lats)
-            lon_span = max(lons) - min(lons)
-
-            # Rough size estimation
-            if lat_span > 0.01 or lon_span > 0.01:
-                return "LARGE"
-            elif lat_span > 0.005 or lon_span > 0.005:
-                return "MEDIUM"
-            else:
-                return "SMALL"
-    return "UNKNOWN"
-
-
-def add_public_areas_overlay(map_obj, bounds):
-    """Add large public areas overlay to the map."""
-    public_data = get_large_public_areas(bounds)
+    Way coordinate arrays are concatenated into a single (N, 2) array and the
+    per-way bounding-box spans come from np.maximum/np.minimum.reduceat over
+    the way offsets.
+    """
+    sizes = ["UNKNOWN"] * len(elements)
+    ways = [
+        i
+        for i, element in enumerate(elements)
+        if element["type"] == "way" and len(element.get("geometry", ())) > 3
+    ]
+    if not ways:
+        return sizes
+
+    convert_way_coordinates([elements[i] for i in ways if "_coords" not in elements[i]])
+    way_arrays = [elements[i]["_coords"] for i in ways]
+    lengths = np.fromiter(map(len, way_arrays), dtype=np.intp, count=len(ways))
+    coords = np.concatenate(way_arrays)
+    offsets = np.concatenate(([0], np.cumsum(lengths[:-1])))
+    spans = np.maximum.reduceat(coords, offsets) - np.minimum.reduceat(
+        coords, offsets
+    )
+    largest_span = spans.max(axis=1)
+
+    # Rough size estimation from the larger of the lat/lon spans
+    labels = np.where(
+        largest_span > 0.01,
+        "LARGE",
+        np.where(largest_span > 0.005, "MEDIUM", "SMALL"),
+    )
+    for i, label in zip(ways, labels.tolist()):
+        sizes[i] = label
+    return sizes
+
+
+def add_public_areas_overlay(map_obj, bounds, public_data=None):
+    """
+    Add large public areas overlay to the map.
+
+    public_data is the result of get_large_public_areas(bounds) when the caller
+    already fetched it; otherwise it is fetched here.
+    """
+    if public_data is None:
+        public_data = get_large_public_areas(bounds)
 
     # Color scheme for different types of public areas
     category_colors = {
@@ -256,13 +352,24 @@ def add_public_areas_overlay(map_obj, bounds):
         )
         feature_group = folium.FeatureGroup(name=f"{colors['name']} ({len(items)})")
 
+        # One coordinate conversion per category, shared by sizing and rendering
+        convert_way_coordinates(
+            [item for item in items if item["type"] == "way" and "geometry" in item]
+        )
+
+        features = []
         category_areas = []
-        for item in items:
-            area_info = add_public_area_to_map(feature_group, item, category, colors)
+        for item, area_size in zip(items, calculate_area_sizes(items)):
+            area_info = add_public_area_to_map(
+                features, item, category, colors, area_size
+            )
             if area_info:
                 category_areas.append(area_info)
             total_areas += 1
 
+        if features:
+            add_public_area_features(feature_group, features, colors)
+
         if len(items) > 0:
             feature_group.add_to(map_obj)
             area_details[category] = category_areas
@@ -271,11 +378,40 @@ def add_public_areas_overlay(map_obj, bounds):
     return map_obj, area_details
 
 
-def add_public_area_to_map(feature_group, item, category, colors):
-    """Add a public area to the feature group with detailed information."""
+def add_public_area_features(feature_group, features, colors):
+    """Add one category's features to its feature group as a single GeoJSON layer."""
+    # Point features share one icon marker for the whole layer
+    marker = None
+    if any(f["geometry"]["type"] == "Point" for f in features):
+        marker = folium.Marker(
+            icon=folium.Icon(color=colors["color"], icon="tree", prefix="fa")
+        )
+
+    # Every polygon in a category shares one style
+    style = {
+        "color": colors["color"],
+        "weight": 2,
+        "fill": True,
+        "fillColor": colors["fillColor"],
+        "fillOpacity": 0.3,
+    }
+
+    # One GeoJSON layer per category instead of one Leaflet object per area
+    folium.GeoJson(
+        {"type": "FeatureCollection", "features": features},
+        style_function=lambda feature: style,
+        marker=marker,
+        popup=folium.GeoJsonPopup(fields=["popup"], labels=False),
+        tooltip=folium.GeoJsonTooltip(fields=["tooltip"], labels=False),
+    ).add_to(feature_group)
+
+
+def add_public_area_to_map(features, item, category, colors, area_size=None):
+    """Append a public area as a GeoJSON feature with detailed information."""
     tags = item.get("tags", {})
     name = tags.get("name", f'Unnamed {category.replace("_", " ")}')
-    area_size = calculate_area_size(item)
+    if area_size is None:
+        area_size = calculate_area_size(item)
 
     # Create detailed popup for public area analysis
     popup_content = f"<b>{name}</b><br>"
@@ -315,29 +451,35 @@ def add_public_area_to_map(feature_group, item, category, colors):
 
     # Add to map based on geometry type
     if item["type"] == "way" and "geometry" in item:
-        coordinates = [[node["lat"], node["lon"]] for node in item["geometry"]]
+        # GeoJSON coordinate order is (lon, lat)
+        coordinates = way_coordinates(item)[:, ::-1].tolist()
 
         if len(coordinates) > 2:
-            folium.Polygon(
-                locations=coordinates,
-                popup=popup_content,
-                tooltip=f"{name} ({area_size})",
-                color=colors["color"],
-                weight=2,
-                fill=True,
-                fillColor=colors["fillColor"],
-                fillOpacity=0.3,
-            ).add_to(feature_group)
+            # GeoJSON rings are explicitly closed (Leaflet closes them implicitly)
+            if coordinates[0] != coordinates[-1]:
+                coordinates.append(coordinates[0])
+            geometry = {"type": "Polygon", "coordinates": [coordinates]}
+            tooltip = f"{name} ({area_size})"
+        else:
+            return area_info
 
     elif item["type"] == "node":
         popup_content += f"📍 {item['lat']:.6f}, {item['lon']:.6f}"
 
-        folium.Marker(
-            location=[item["lat"], item["lon"]],
-            popup=popup_content,
-            tooltip=name,
-            icon=folium.Icon(color=colors["color"], icon="tree", prefix="fa"),
-        ).add_to(feature_group)
+        # Point location, rendered with the layer's marker
+        geometry = {"type": "Point", "coordinates": [item["lon"], item["lat"]]}
+        tooltip = name
+
+    else:
+        return area_info
+
+    features.append(
+        {
+            "type": "Feature",
+            "geometry": geometry,
+            "properties": {"name": name, "popup": popup_content, "tooltip": tooltip},
+        }
+    )
 
     return area_info
 
@@ -363,16 +505,18 @@ def main():
     ]
 
     # Calculate center and bounds
-    center_lat = sum(coord[0] for coord in corners) / len(corners)
-    center_lon = sum(coord[1] for coord in corners) / len(corners)
-
-    lats = [corner[0] for corner in corners]
-    lons = [corner[1] for corner in corners]
+    corner_array = np.asarray(corners, dtype=np.float64)
+    center_lat, center_lon = corner_array.mean(axis=0).tolist()
 
-    south, north = min(lats) - 0.005, max(lats) + 0.005
-    west, east = min(lons) - 0.005, max(lons) + 0.005
+    south, west = (corner_array.min(axis=0) - 0.005).tolist()
+    north, east = (corner_array.max(axis=0) + 0.005).tolist()
     bounds = (south, west, north, east)
 
+    # Start the Overpass request first and build the map while it is in flight
+    executor = ThreadPoolExecutor(max_workers=1)
+    public_data_future = executor.submit(get_large_public_areas, bounds)
+    executor.shutdown(wait=False)
+
     # Create enhanced map
     public_map = folium.Map(location=[center_lat, center_lon], zoom_start=13)
 
@@ -394,7 +538,9 @@ def main():
     ).add_to(public_map)
 
     # Add large public areas overlay
-    public_map, area_details = add_public_areas_overlay(public_map, bounds)
+    public_map, area_details = add_public_areas_overlay(
+        public_map, bounds, public_data_future.result()
+    )
 
     # Add corner markers
     colors = ["red", "blue", "green", "purple"]
@@ -8,7 +8,10 @@ Creates focused search bands and updates the map.
 import folium
 import math
 from shapely.geometry import Point, Polygon, LineString
-import json
+
+MILES_PER_DEG_LAT = 69.0  # roughly 69 miles per degree latitude
+DEG_LAT_PER_MILE = 1.0 / MILES_PER_DEG_LAT
+SEARCH_WIDTH_MILES = 0.05  # assumed width of the walked search band
 
 
 def calculate_latitude_search_band(drop_point, radius_miles, given_latitude):
@@ -17,7 +20,7 @@ def calculate_latitude_search_band(drop_point, radius_miles, given_latitude):
     center_lat, center_lon = drop_point
 
     # Convert radius to degrees (approximate)
-    radius_degrees = radius_miles / 69.0  # roughly 69 miles per degree latitude
+    radius_degrees = radius_miles * DEG_LAT_PER_MILE
 
     # Distance from circle center to the given latitude line
     lat_distance = abs(given_latitude - center_lat)
@@ -25,15 +28,19 @@ def calculate_latitude_search_band(drop_point, radius_miles, given_latitude):
     if lat_distance > radius_degrees:
         return None, "Latitude line doesn't intersect the search circle"
 
-    # Using Pythagorean theorem to find where latitude line intersects circle
-    half_chord_degrees = math.sqrt(radius_degrees**2 - lat_distance**2)
-    half_chord_miles = half_chord_degrees * 69.0
+    # Using Pythagorean theorem to find where latitude line intersects circle;
+    # r^2 - d^2 factored as (r - d)(r + d) stays accurate for short chords
+    half_chord_degrees = math.sqrt(
+        (radius_degrees - lat_distance) * (radius_degrees + lat_distance)
+    )
+    half_chord_miles = half_chord_degrees * MILES_PER_DEG_LAT
 
-    # Calculate intersection points
-    west_intersection = (
-        center_lon - half_chord_degrees * 1.3
-    )  # adjust for longitude scaling
-    east_intersection = center_lon + half_chord_degrees * 1.3
+    # Calculate intersection points; a degree of longitude spans cos(lat)
+    # times the distance of a degree of latitude
+    lon_scale = 1.0 / math.cos(math.radians(center_lat))
+    half_chord_lon = half_chord_degrees * lon_scale
+    west_intersection = center_lon - half_chord_lon
+    east_intersection = center_lon + half_chord_lon
 
     # Search band coordinates
     search_band = {
@@ -41,12 +48,12 @@ def calculate_latitude_search_band(drop_point, radius_miles, given_latitude):
         "west_point": [given_latitude, west_intersection],
         "east_point": [given_latitude, east_intersection],
         "band_width_miles": 2 * half_chord_miles,
-        "center_distance_miles": lat_distance * 69.0,
+        "center_distance_miles": lat_distance * MILES_PER_DEG_LAT,
     }
 
     # Calculate area reduction
     circle_area = math.pi * radius_miles**2
-    band_area = search_band["band_width_miles"] * 0.05  # assume 0.05 mile search width
+    band_area = search_band["band_width_miles"] * SEARCH_WIDTH_MILES
     area_reduction_percent = (1 - band_area / circle_area) * 100
 
     search_band["area_reduction_percent"] = area_reduction_percent
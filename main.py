@@ -2,6 +2,7 @@ import folium
 import math
 import os
 import webbrowser
+import numpy as np
 from public_areas import PublicAreasOverlay
 
 MAP_NAME = "veil.html"
@@ -98,6 +99,35 @@ MAP_ELEMENTS = [
 ]
 
 
+def sector_bearings(
+    center_lat, center_lon, bearing_lat, bearing_lon, width_degrees, rotation_degrees=0
+):
+    """
+    Center, left and right boundary bearings of a sector, in radians.
+
+    The center bearing points from the center point to the bearing point and is
+    then rotated by rotation_degrees (positive = clockwise); the boundaries lie
+    half the width to either side.
+    """
+    # Calculate bearing from center point to bearing point
+    lat1, lon1 = math.radians(center_lat), math.radians(center_lon)
+    lat2, lon2 = math.radians(bearing_lat), math.radians(bearing_lon)
+
+    dlon = lon2 - lon1
+    bearing_center = math.atan2(
+        math.sin(dlon) * math.cos(lat2),
+        math.cos(lat1) * math.sin(lat2)
+        - math.sin(lat1) * math.cos(lat2) * math.cos(dlon),
+    )
+
+    # Apply rotation to the center bearing
+    bearing_center += math.radians(rotation_degrees)
+
+    # Calculate left and right bearings
+    half_width = math.radians(width_degrees / 2)
+    return bearing_center, bearing_center - half_width, bearing_center + half_width
+
+
 def create_sector_polygon(
     center_lat,
     center_lon,
@@ -122,69 +152,130 @@ def create_sector_polygon(
     Returns:
         List of [lat, lon] coordinates forming the polygon
     """
-    # Calculate bearing from center point to bearing point
-    lat1, lon1 = math.radians(center_lat), math.radians(center_lon)
-    lat2, lon2 = math.radians(bearing_lat), math.radians(bearing_lon)
-
-    dlon = lon2 - lon1
-    bearing_center = math.atan2(
-        math.sin(dlon) * math.cos(lat2),
-        math.cos(lat1) * math.sin(lat2)
-        - math.sin(lat1) * math.cos(lat2) * math.cos(dlon),
+    _, bearing_left, bearing_right = sector_bearings(
+        center_lat,
+        center_lon,
+        bearing_lat,
+        bearing_lon,
+        width_degrees,
+        rotation_degrees,
     )
 
-    # Apply rotation to the center bearing
-    rotation_rad = math.radians(rotation_degrees)
-    bearing_center += rotation_rad
-
-    # Convert degrees to radians
-    half_width = math.radians(width_degrees / 2)
-
-    # Calculate left and right bearings
-    bearing_left = bearing_center - half_width
-    bearing_right = bearing_center + half_width
-
     # Convert miles to approximate degrees (1 degree ≈ 69 miles)
     min_radius_deg = min_radius_miles / 69.0
     max_radius_deg = max_radius_miles / 69.0
 
-    # Create polygon points
-    polygon_points = []
+    # Longitude degrees shrink by cos(latitude); same for every point
+    lon_scale = 1 / math.cos(math.radians(center_lat))
 
-    # Arc along minimum radius from left to right
+    # Both arcs share the same bearings, so one sin/cos pair per bearing gives
+    # the inner point and the outer point
+    inner_arc = []
+    outer_arc = []
     num_arc_points = 20  # Number of points to approximate the arc
     for i in range(num_arc_points + 1):
         # Interpolate bearing from left to right
         bearing = bearing_left + (bearing_right - bearing_left) * i / num_arc_points
+        d_lat = math.cos(bearing)
+        d_lon = math.sin(bearing) * lon_scale
 
-        # Calculate point on inner circle
-        lat = center_lat + min_radius_deg * math.cos(bearing)
-        lon = center_lon + min_radius_deg * math.sin(bearing) / math.cos(
-            math.radians(center_lat)
+        inner_arc.append(
+            [center_lat + min_radius_deg * d_lat, center_lon + min_radius_deg * d_lon]
+        )
+        outer_arc.append(
+            [center_lat + max_radius_deg * d_lat, center_lon + max_radius_deg * d_lon]
         )
-        polygon_points.append([lat, lon])
 
-    # Arc along maximum radius from right to left
-    for i in range(num_arc_points + 1):
-        # Interpolate bearing from right to left
-        bearing = bearing_right - (bearing_right - bearing_left) * i / num_arc_points
+    # Arc along minimum radius from left to right, maximum radius from right to
+    # left, then close back to the start of the min radius arc (no center point)
+    polygon_points = inner_arc + outer_arc[::-1] + [list(inner_arc[0])]
 
-        # Calculate point on outer circle
-        lat = center_lat + max_radius_deg * math.cos(bearing)
-        lon = center_lon + max_radius_deg * math.sin(bearing) / math.cos(
-            math.radians(center_lat)
+    return polygon_points
+
+
+def create_sector_polygons_batch(
+    center_lat,
+    center_lon,
+    bearing_lat,
+    bearing_lon,
+    width_degrees,
+    min_radius_miles,
+    max_radius_miles,
+    rotation_degrees=0,
+    num_arc_points=20,
+):
+    """
+    Vectorized create_sector_polygon for many sectors at once.
+
+    Every argument is a scalar or an array of length N; they are broadcast
+    together, so e.g. one center with N rotations gives N rotated sectors.
+
+    Returns:
+        (N, 2 * num_arc_points + 3, 2) array of [lat, lon] rings, in the same
+        point order as create_sector_polygon
+    """
+    (
+        center_lat,
+        center_lon,
+        bearing_lat,
+        bearing_lon,
+        width_degrees,
+        min_radius_miles,
+        max_radius_miles,
+        rotation_degrees,
+    ) = np.broadcast_arrays(
+        *(
+            np.atleast_1d(np.asarray(value, dtype=np.float64))
+            for value in (
+                center_lat,
+                center_lon,
+                bearing_lat,
+                bearing_lon,
+                width_degrees,
+                min_radius_miles,
+                max_radius_miles,
+                rotation_degrees,
+            )
         )
-        polygon_points.append([lat, lon])
+    )
+
+    # Bearing from each center point to its bearing point, plus rotation
+    lat1, lon1 = np.radians(center_lat), np.radians(center_lon)
+    lat2, lon2 = np.radians(bearing_lat), np.radians(bearing_lon)
+    dlon = lon2 - lon1
+    bearing_center = np.arctan2(
+        np.sin(dlon) * np.cos(lat2),
+        np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(dlon),
+    ) + np.radians(rotation_degrees)
 
-    # Close polygon back to start of min radius arc (no center point)
-    bearing = bearing_left
-    lat = center_lat + min_radius_deg * math.cos(bearing)
-    lon = center_lon + min_radius_deg * math.sin(bearing) / math.cos(
-        math.radians(center_lat)
+    half_width = np.radians(width_degrees / 2)
+    bearing_left = bearing_center - half_width
+    bearing_right = bearing_center + half_width
+
+    # (N, num_arc_points + 1) bearings from left to right; one cos/sin grid is
+    # shared by the inner and outer arcs
+    steps = np.arange(num_arc_points + 1)
+    arc = (
+        bearing_left[:, None]
+        + (bearing_right - bearing_left)[:, None] * steps / num_arc_points
     )
-    polygon_points.append([lat, lon])
+    d_lat = np.cos(arc)
+    d_lon = np.sin(arc) / np.cos(np.radians(center_lat))[:, None]
+
+    def arc_points(radius_miles):
+        radius_deg = (radius_miles / 69.0)[:, None]
+        return np.stack(
+            [
+                center_lat[:, None] + radius_deg * d_lat,
+                center_lon[:, None] + radius_deg * d_lon,
+            ],
+            axis=-1,
+        )
 
-    return polygon_points
+    inner = arc_points(min_radius_miles)
+    outer = arc_points(max_radius_miles)
+    # Inner arc left to right, outer arc right to left, closed at the inner start
+    return np.concatenate([inner, outer[:, ::-1], inner[:, :1]], axis=1)
 
 
 def add_sector_to_map(map_obj, sector_config):
@@ -234,35 +325,25 @@ def add_sector_to_map(map_obj, sector_config):
         fillOpacity=0.1,
     ).add_to(map_obj)
 
-    # Calculate bearing and reference line coordinates
-    lat1, lon1 = math.radians(center_lat), math.radians(center_lon)
-    lat2, lon2 = math.radians(bearing_lat), math.radians(bearing_lon)
-    dlon = lon2 - lon1
-    bearing_center = math.atan2(
-        math.sin(dlon) * math.cos(lat2),
-        math.cos(lat1) * math.sin(lat2)
-        - math.sin(lat1) * math.cos(lat2) * math.cos(dlon),
-    )
-
-    # Apply rotation
-    bearing_center += math.radians(rotation_degrees)
-
     # Calculate reference line bearings
-    half_width = math.radians(width_degrees / 2)
-    bearing_left = bearing_center - half_width
-    bearing_right = bearing_center + half_width
+    bearing_center, bearing_left, bearing_right = sector_bearings(
+        center_lat,
+        center_lon,
+        bearing_lat,
+        bearing_lon,
+        width_degrees,
+        rotation_degrees,
+    )
 
     # Convert miles to degrees
     min_radius_deg = min_radius_miles / 69.0
     max_radius_deg = max_radius_miles / 69.0
+    lon_scale = 1 / math.cos(math.radians(center_lat))
 
     # Red center line (center to max radius)
     center_line_end = [
         center_lat + max_radius_deg * math.cos(bearing_center),
-        center_lon
-        + max_radius_deg
-        * math.sin(bearing_center)
-        / math.cos(math.radians(center_lat)),
+        center_lon + max_radius_deg * math.sin(bearing_center) * lon_scale,
     ]
     folium.PolyLine(
         locations=[[center_lat, center_lon], center_line_end],
@@ -277,8 +358,7 @@ def add_sector_to_map(map_obj, sector_config):
     # Purple left boundary line (center to min radius)
     left_line_end = [
         center_lat + min_radius_deg * math.cos(bearing_left),
-        center_lon
-        + min_radius_deg * math.sin(bearing_left) / math.cos(math.radians(center_lat)),
+        center_lon + min_radius_deg * math.sin(bearing_left) * lon_scale,
     ]
     folium.PolyLine(
         locations=[[center_lat, center_lon], left_line_end],
@@ -293,8 +373,7 @@ def add_sector_to_map(map_obj, sector_config):
     # Purple right boundary line (center to min radius)
     right_line_end = [
         center_lat + min_radius_deg * math.cos(bearing_right),
-        center_lon
-        + min_radius_deg * math.sin(bearing_right) / math.cos(math.radians(center_lat)),
+        center_lon + min_radius_deg * math.sin(bearing_right) * lon_scale,
     ]
     folium.PolyLine(
         locations=[[center_lat, center_lon], right_line_end],
@@ -1,12 +1,82 @@
 """
 Public Areas Utility Functions
 
-Helper functions to easily enable/disable and configure public areas on your maps.
+Helper functions to easily enable/disable and configure public areas on your maps,
+plus the Overpass response streaming helpers shared by the public area scripts.
 """
 
 from main import create_map_with_all_datasets, PUBLIC_AREAS_CONFIG
+import json
 import os
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+class TeeReader:
+    """File-like wrapper that copies everything read from `source` into `sink`."""
+
+    def __init__(self, source, sink):
+        self.source = source
+        self.sink = sink
+
+    def read(self, size=-1):
+        chunk = self.source.read(size)
+        self.sink.write(chunk)
+        return chunk
+
+
+def iter_overpass_elements(stream):
+    """Yield the `elements` of an Overpass JSON response from a binary stream."""
+    if IJSON_AVAILABLE:
+        yield from ijson.items(stream, "elements.item", use_float=True)
+    elif ORJSON_AVAILABLE:
+        yield from orjson.loads(stream.read()).get("elements", [])
+    else:
+        yield from json.load(stream).get("elements", [])
+
+
+def stream_overpass_response(response, cache_file, open_cache=open):
+    """
+    Yield the elements of a streamed Overpass response while writing the raw
+    body through to cache_file.
+
+    The body is written to a ".partial" file that only replaces cache_file once
+    it has been fully received, so a failed transfer is never cached. The
+    response is closed when the generator finishes or is closed.
+
+    Args:
+        response: requests response opened with stream=True
+        cache_file: Path of the cache entry to write
+        open_cache: Opener for the cache file (e.g. gzip.open)
+    """
+    response.raw.decode_content = True
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    partial_file = cache_file.with_suffix(".partial")
+    try:
+        with open_cache(partial_file, "wb") as cache_out:
+            tee = TeeReader(response.raw, cache_out)
+            yield from iter_overpass_elements(tee)
+            # Copy anything after the elements array (e.g. "remark")
+            while tee.read(1 << 16):
+                pass
+        partial_file.replace(cache_file)
+    finally:
+        response.close()
+        if partial_file.exists():
+            partial_file.unlink()
+
 
 def create_map_with_public_areas(area_types=None, padding_miles=5):
     """